@@ -20,7 +20,7 @@ func parseEvalBatchFlags(cmd *cli.Command) (*evalBatchFlags, error) {
 		FromSuite:       cmd.String("from-suite"),
 		DeckDir:         cmd.String("deck-dir"),
 		PlayerTag:       cmd.String("tag"),
-		Format:          cmd.String("format"),
+		Format:          strings.ToLower(cmd.String("format")),
 		OutputDir:       cmd.String("output-dir"),
 		SortBy:          cmd.String("sort-by"),
 		TopOnly:         cmd.Bool("top-only"),
@@ -508,14 +508,15 @@ func applyEvalTopNFilter(results []evalBatchResult, topOnly bool, topN int) []ev
 	return results[:topN]
 }
 
-// formatEvalBatchResults formats evaluation results according to the specified format
+// formatEvalBatchResults formats evaluation results according to the specified format.
+// The format is expected to be lowercased already by parseEvalBatchFlags.
 func formatEvalBatchResults(
 	results []evalBatchResult,
 	format, sortBy, playerName, playerTag string,
 	totalDecks int,
 	totalTime time.Duration,
 ) (string, error) {
-	switch strings.ToLower(format) {
+	switch format {
 	case "summary", compareFormatHuman:
 		return formatEvaluationBatchSummary(results, totalDecks, totalTime, sortBy, playerName, playerTag), nil
 	case batchFormatJSON:
@@ -0,0 +1,167 @@
+package main
+
+import (
+	"encoding/csv"
+	"fmt"
+	"os"
+	"path/filepath"
+	"strconv"
+	"strings"
+
+	"github.com/klauer/clash-royale-api/go/pkg/events"
+)
+
+// csvRecordWriter wraps a csv.Writer and keeps the first write error so report
+// sections can be emitted without checking every record individually.
+type csvRecordWriter struct {
+	w   *csv.Writer
+	err error
+}
+
+func (c *csvRecordWriter) write(record ...string) {
+	if c.err != nil {
+		return
+	}
+	c.err = c.w.Write(record)
+}
+
+func (c *csvRecordWriter) flush() error {
+	c.w.Flush()
+	if c.err != nil {
+		return c.err
+	}
+	return c.w.Error()
+}
+
+func formatCSVFloat(v float64, prec int) string {
+	return strconv.FormatFloat(v, 'f', prec, 64)
+}
+
+// exportAnalysisToCSV exports event analysis to CSV format
+func exportAnalysisToCSV(dataDir string, analysis *events.EventAnalysis) error {
+	analysisDir := filepath.Join(dataDir, "csv", "analysis")
+	if err := os.MkdirAll(analysisDir, 0o755); err != nil {
+		return fmt.Errorf("failed to create analysis directory: %w", err)
+	}
+
+	// Create summary CSV
+	summaryFile := filepath.Join(analysisDir, fmt.Sprintf("event_analysis_%s_%s.csv",
+		analysis.PlayerTag, analysis.AnalysisTime.Format("20060102_150405")))
+
+	file, err := os.Create(summaryFile)
+	if err != nil {
+		return fmt.Errorf("failed to create analysis CSV: %w", err)
+	}
+	defer closeFile(file)
+
+	rw := &csvRecordWriter{w: csv.NewWriter(file)}
+	writeEventAnalysisSummaryCSV(rw, analysis)
+	writeEventAnalysisCardsCSV(rw, analysis)
+	writeEventAnalysisDecksCSV(rw, analysis)
+	writeEventAnalysisMatchupsCSV(rw, analysis)
+
+	if err := rw.flush(); err != nil {
+		return fmt.Errorf("failed to write analysis CSV: %w", err)
+	}
+	return nil
+}
+
+func writeEventAnalysisSummaryCSV(rw *csvRecordWriter, analysis *events.EventAnalysis) {
+	rw.write("Event Analysis Summary")
+	rw.write("Player Tag", analysis.PlayerTag)
+	rw.write("Analysis Time", analysis.AnalysisTime.Format("2006-01-02 15:04:05"))
+	rw.write("Total Decks", strconv.Itoa(analysis.TotalDecks))
+	rw.write()
+	rw.write("Performance Summary")
+	rw.write("Total Battles", strconv.Itoa(analysis.Summary.TotalBattles))
+	rw.write("Total Wins", strconv.Itoa(analysis.Summary.TotalWins))
+	rw.write("Total Losses", strconv.Itoa(analysis.Summary.TotalLosses))
+	rw.write("Overall Win Rate", formatCSVFloat(analysis.Summary.OverallWinRate, 2))
+	rw.write("Average Crowns per Battle", formatCSVFloat(analysis.Summary.AvgCrownsPerBattle, 2))
+	rw.write("Average Deck Elixir", formatCSVFloat(analysis.Summary.AvgDeckElixir, 1))
+}
+
+func writeEventAnalysisCardsCSV(rw *csvRecordWriter, analysis *events.EventAnalysis) {
+	if len(analysis.CardAnalysis.MostUsedCards) > 0 {
+		rw.write()
+		rw.write("Most Used Cards")
+		rw.write("Card", "Times Used")
+		for _, card := range analysis.CardAnalysis.MostUsedCards {
+			rw.write(card.CardName, strconv.Itoa(card.Count))
+		}
+	}
+
+	if len(analysis.CardAnalysis.HighestWinRateCards) > 0 {
+		rw.write()
+		rw.write("Highest Win Rate Cards")
+		rw.write("Card", "Win Rate")
+		for _, card := range analysis.CardAnalysis.HighestWinRateCards {
+			rw.write(card.CardName, formatCSVFloat(card.WinRate, 2))
+		}
+	}
+}
+
+func writeEventAnalysisDecksCSV(rw *csvRecordWriter, analysis *events.EventAnalysis) {
+	if len(analysis.EventBreakdown) > 0 {
+		rw.write()
+		rw.write("Event Type Performance")
+		rw.write("Event Type", "Count", "Wins", "Losses", "Win Rate")
+		for eventType, stats := range analysis.EventBreakdown {
+			winRate := float64(0)
+			if stats.Wins+stats.Losses > 0 {
+				winRate = float64(stats.Wins) / float64(stats.Wins+stats.Losses)
+			}
+			rw.write(eventType, strconv.Itoa(stats.Count), strconv.Itoa(stats.Wins),
+				strconv.Itoa(stats.Losses), formatCSVFloat(winRate, 2))
+		}
+	}
+
+	if len(analysis.TopDecks) > 0 {
+		rw.write()
+		rw.write("Top Performing Decks")
+		rw.write("Rank", "Event Name", "Event Type", "Win Rate", "Record", "Avg Elixir", "Deck")
+		for i, deck := range analysis.TopDecks {
+			rw.write(strconv.Itoa(i+1), deck.EventName, deck.EventType, formatCSVFloat(deck.WinRate, 2),
+				deck.Record, formatCSVFloat(deck.AvgElixir, 1), strings.Join(deck.Deck, "|"))
+		}
+	}
+}
+
+func writeEventAnalysisMatchupsCSV(rw *csvRecordWriter, analysis *events.EventAnalysis) {
+	if len(analysis.MatchupAnalysis.TopWinningMatchups) > 0 {
+		rw.write()
+		rw.write("Top Winning Deck Matchups")
+		rw.write("Player Deck Hash", "Opponent Deck Hash", "Battles", "Wins", "Losses", "Draws",
+			"Win Rate", "Player Deck", "Opponent Deck")
+		for _, matchup := range analysis.MatchupAnalysis.TopWinningMatchups {
+			rw.write(
+				matchup.PlayerDeckHash,
+				matchup.OpponentDeckHash,
+				strconv.Itoa(matchup.Battles),
+				strconv.Itoa(matchup.Wins),
+				strconv.Itoa(matchup.Losses),
+				strconv.Itoa(matchup.Draws),
+				formatCSVFloat(matchup.WinRate, 2),
+				strings.Join(matchup.PlayerDeck, "|"),
+				strings.Join(matchup.OpponentDeck, "|"),
+			)
+		}
+	}
+
+	if len(analysis.MatchupAnalysis.ArchetypeMatchups) > 0 {
+		rw.write()
+		rw.write("Archetype Matchups")
+		rw.write("Player Archetype", "Opponent Archetype", "Battles", "Wins", "Losses", "Draws", "Win Rate")
+		for _, matchup := range analysis.MatchupAnalysis.ArchetypeMatchups {
+			rw.write(
+				matchup.PlayerArchetype,
+				matchup.OpponentArchetype,
+				strconv.Itoa(matchup.Battles),
+				strconv.Itoa(matchup.Wins),
+				strconv.Itoa(matchup.Losses),
+				strconv.Itoa(matchup.Draws),
+				formatCSVFloat(matchup.WinRate, 2),
+			)
+		}
+	}
+}
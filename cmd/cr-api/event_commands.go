@@ -4,7 +4,6 @@ import (
 	"context"
 	"fmt"
 	"os"
-	"path/filepath"
 	"strings"
 	"text/tabwriter"
 	"time"
@@ -601,21 +600,21 @@ func displayEventStats(collection *events.EventDeckCollection) {
 	}
 }
 
+// loadEventDeckCollection loads the collection written by event scans, decoding
+// the stored collection.json directly. A player without stored decks gets an
+// empty collection.
 func loadEventDeckCollection(dataDir, playerTag string) (*events.EventDeckCollection, error) {
-	// In a real implementation, unmarshal from JSON from:
-	// filepath.Join(dataDir, "event_decks", fmt.Sprintf("%s.json", playerTag))
-
-	// In a real implementation, unmarshal from JSON
-	// For now, return empty collection
-	return &events.EventDeckCollection{
-		PlayerTag: playerTag,
-		Decks:     []events.EventDeck{},
-	}, nil
+	return events.NewManager(dataDir).GetCollection(playerTag)
 }
 
 func filterEventDecks(collection *events.EventDeckCollection, eventType string, days, minBattles int) []events.EventDeck {
 	var filtered []events.EventDeck
 
+	var cutoff time.Time
+	if days > 0 {
+		cutoff = time.Now().AddDate(0, 0, -days)
+	}
+
 	for _, deck := range collection.Decks {
 		// Filter by event type
 		if eventType != "" && string(deck.EventType) != eventType {
@@ -623,11 +622,8 @@ func filterEventDecks(collection *events.EventDeckCollection, eventType string,
 		}
 
 		// Filter by days
-		if days > 0 {
-			cutoff := deck.StartTime.AddDate(0, 0, -days)
-			if deck.StartTime.Before(cutoff) {
-				continue
-			}
+		if days > 0 && deck.StartTime.Before(cutoff) {
+			continue
 		}
 
 		// Filter by minimum battles
@@ -792,116 +788,3 @@ func displayComprehensiveAnalysis(analysis *events.EventAnalysis, includeDecks b
 		printf("Run 'cr-api events list --tag %s' for detailed deck information\n", analysis.PlayerTag)
 	}
 }
-
-// exportAnalysisToCSV exports event analysis to CSV format
-func exportAnalysisToCSV(dataDir string, analysis *events.EventAnalysis) error {
-	analysisDir := filepath.Join(dataDir, "csv", "analysis")
-	if err := os.MkdirAll(analysisDir, 0o755); err != nil {
-		return fmt.Errorf("failed to create analysis directory: %w", err)
-	}
-
-	// Create summary CSV
-	summaryFile := filepath.Join(analysisDir, fmt.Sprintf("event_analysis_%s_%s.csv",
-		analysis.PlayerTag, analysis.AnalysisTime.Format("20060102_150405")))
-
-	file, err := os.Create(summaryFile)
-	if err != nil {
-		return fmt.Errorf("failed to create analysis CSV: %w", err)
-	}
-	defer closeFile(file)
-
-	// Write analysis summary
-	fprintf(file, "Event Analysis Summary\n")
-	fprintf(file, "Player Tag,%s\n", analysis.PlayerTag)
-	fprintf(file, "Analysis Time,%s\n", analysis.AnalysisTime.Format("2006-01-02 15:04:05"))
-	fprintf(file, "Total Decks,%d\n", analysis.TotalDecks)
-	fprintf(file, "\nPerformance Summary\n")
-	fprintf(file, "Total Battles,%d\n", analysis.Summary.TotalBattles)
-	fprintf(file, "Total Wins,%d\n", analysis.Summary.TotalWins)
-	fprintf(file, "Total Losses,%d\n", analysis.Summary.TotalLosses)
-	fprintf(file, "Overall Win Rate,%.2f\n", analysis.Summary.OverallWinRate)
-	fprintf(file, "Average Crowns per Battle,%.2f\n", analysis.Summary.AvgCrownsPerBattle)
-	fprintf(file, "Average Deck Elixir,%.1f\n", analysis.Summary.AvgDeckElixir)
-
-	// Write card usage
-	if len(analysis.CardAnalysis.MostUsedCards) > 0 {
-		fprintf(file, "\nMost Used Cards\n")
-		fprintf(file, "Card,Times Used\n")
-		for _, card := range analysis.CardAnalysis.MostUsedCards {
-			fprintf(file, "%s,%d\n", card.CardName, card.Count)
-		}
-	}
-
-	// Write highest win rate cards
-	if len(analysis.CardAnalysis.HighestWinRateCards) > 0 {
-		fprintf(file, "\nHighest Win Rate Cards\n")
-		fprintf(file, "Card,Win Rate\n")
-		for _, card := range analysis.CardAnalysis.HighestWinRateCards {
-			fprintf(file, "%s,%.2f\n", card.CardName, card.WinRate)
-		}
-	}
-
-	// Write event breakdown
-	if len(analysis.EventBreakdown) > 0 {
-		fprintf(file, "\nEvent Type Performance\n")
-		fprintf(file, "Event Type,Count,Wins,Losses,Win Rate\n")
-		for eventType, stats := range analysis.EventBreakdown {
-			winRate := float64(0)
-			if stats.Wins+stats.Losses > 0 {
-				winRate = float64(stats.Wins) / float64(stats.Wins+stats.Losses)
-			}
-			fprintf(file, "%s,%d,%d,%d,%.2f\n",
-				eventType, stats.Count, stats.Wins, stats.Losses, winRate)
-		}
-	}
-
-	// Write top decks
-	if len(analysis.TopDecks) > 0 {
-		fprintf(file, "\nTop Performing Decks\n")
-		fprintf(file, "Rank,Event Name,Event Type,Win Rate,Record,Avg Elixir,Deck\n")
-		for i, deck := range analysis.TopDecks {
-			deckStr := strings.Join(deck.Deck, "|")
-			fprintf(file, "%d,%s,%s,%.2f,%s,%.1f,%s\n",
-				i+1, deck.EventName, deck.EventType, deck.WinRate,
-				deck.Record, deck.AvgElixir, deckStr)
-		}
-	}
-
-	if len(analysis.MatchupAnalysis.TopWinningMatchups) > 0 {
-		fprintf(file, "\nTop Winning Deck Matchups\n")
-		fprintf(file, "Player Deck Hash,Opponent Deck Hash,Battles,Wins,Losses,Draws,Win Rate,Player Deck,Opponent Deck\n")
-		for _, matchup := range analysis.MatchupAnalysis.TopWinningMatchups {
-			playerDeck := strings.Join(matchup.PlayerDeck, "|")
-			opponentDeck := strings.Join(matchup.OpponentDeck, "|")
-			fprintf(file, "%s,%s,%d,%d,%d,%d,%.2f,%s,%s\n",
-				matchup.PlayerDeckHash,
-				matchup.OpponentDeckHash,
-				matchup.Battles,
-				matchup.Wins,
-				matchup.Losses,
-				matchup.Draws,
-				matchup.WinRate,
-				playerDeck,
-				opponentDeck,
-			)
-		}
-	}
-
-	if len(analysis.MatchupAnalysis.ArchetypeMatchups) > 0 {
-		fprintf(file, "\nArchetype Matchups\n")
-		fprintf(file, "Player Archetype,Opponent Archetype,Battles,Wins,Losses,Draws,Win Rate\n")
-		for _, matchup := range analysis.MatchupAnalysis.ArchetypeMatchups {
-			fprintf(file, "%s,%s,%d,%d,%d,%d,%.2f\n",
-				matchup.PlayerArchetype,
-				matchup.OpponentArchetype,
-				matchup.Battles,
-				matchup.Wins,
-				matchup.Losses,
-				matchup.Draws,
-				matchup.WinRate,
-			)
-		}
-	}
-
-	return nil
-}
@@ -1,6 +1,11 @@
 package main
 
-import "testing"
+import (
+	"testing"
+	"time"
+
+	"github.com/klauer/clash-royale-api/go/pkg/events"
+)
 
 func TestRequireEventAPITokenUsesExplicitToken(t *testing.T) {
 	t.Setenv(apiTokenEnvVar, "")
@@ -37,3 +42,60 @@ func TestRequireEventAPITokenReturnsRequiredMessageWhenMissing(t *testing.T) {
 		t.Fatalf("requireEventAPIToken() error = %q, want %q", err.Error(), requiredAPITokenMessage)
 	}
 }
+
+func TestFilterEventDecksAppliesDaysCutoffFromNow(t *testing.T) {
+	now := time.Now()
+	collection := &events.EventDeckCollection{
+		Decks: []events.EventDeck{
+			{EventID: "recent", StartTime: now.AddDate(0, 0, -2)},
+			{EventID: "stale", StartTime: now.AddDate(0, 0, -30)},
+		},
+	}
+
+	got := filterEventDecks(collection, "", 7, 0)
+	if len(got) != 1 || got[0].EventID != "recent" {
+		t.Fatalf("filterEventDecks() = %+v, want only the recent deck", got)
+	}
+
+	if all := filterEventDecks(collection, "", 0, 0); len(all) != 2 {
+		t.Fatalf("filterEventDecks() with no day limit returned %d decks, want 2", len(all))
+	}
+}
+
+func TestLoadEventDeckCollectionReturnsSavedDecks(t *testing.T) {
+	dataDir := t.TempDir()
+	deck := &events.EventDeck{
+		EventID:   "challenge-1",
+		PlayerTag: "#ABC123",
+		EventName: "Classic Challenge",
+		EventType: events.EventTypeChallenge,
+		StartTime: time.Date(2024, 1, 15, 10, 0, 0, 0, time.UTC),
+	}
+	if err := events.NewManager(dataDir).SaveEventDeck(deck); err != nil {
+		t.Fatalf("SaveEventDeck() unexpected error: %v", err)
+	}
+
+	collection, err := loadEventDeckCollection(dataDir, "#ABC123")
+	if err != nil {
+		t.Fatalf("loadEventDeckCollection() unexpected error: %v", err)
+	}
+	if len(collection.Decks) != 1 || collection.Decks[0].EventID != "challenge-1" {
+		t.Fatalf("loadEventDeckCollection() decks = %+v, want the saved deck", collection.Decks)
+	}
+}
+
+func TestLoadEventDeckCollectionReturnsEmptyCollectionWhenMissing(t *testing.T) {
+	collection, err := loadEventDeckCollection(t.TempDir(), "#ABC123")
+	if err != nil {
+		t.Fatalf("loadEventDeckCollection() unexpected error: %v", err)
+	}
+	if collection.PlayerTag != "#ABC123" || len(collection.Decks) != 0 {
+		t.Fatalf("loadEventDeckCollection() = %+v, want an empty collection for #ABC123", collection)
+	}
+}
+
+func TestLoadEventDeckCollectionRejectsInvalidTag(t *testing.T) {
+	if _, err := loadEventDeckCollection(t.TempDir(), "../ABC"); err == nil {
+		t.Fatal("loadEventDeckCollection() expected error for invalid tag, got nil")
+	}
+}
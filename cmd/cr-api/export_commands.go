@@ -6,6 +6,7 @@ import (
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/klauer/clash-royale-api/go/internal/exporter/csv"
@@ -76,29 +77,40 @@ func applyTimestampToExport(path, timestamp string) (string, error) {
 	return target, nil
 }
 
+// playerExportTypes maps each supported player export type to the exports it writes.
+var playerExportTypes = map[string][]func(dataDir, exportDir string, player *clashroyale.Player) error{
+	"summary": {exportPlayerSummary},
+	"cards":   {exportPlayerCards},
+	"all":     {exportPlayerSummary, exportPlayerCards},
+}
+
+// hasPlayerExportType reports whether any requested type is one exportPlayerType writes.
+func hasPlayerExportType(types []string) bool {
+	for _, exportType := range types {
+		if _, ok := playerExportTypes[exportType]; ok {
+			return true
+		}
+	}
+	return false
+}
+
 func exportPlayerType(exportType, dataDir, exportDir string, player *clashroyale.Player) error {
-	exportSummary := func() error {
-		exporter := csv.NewPlayerExporter()
-		return exportWithFeedback(exporterFunc(exporter), dataDir, player, "player summary", exportTargetFile(exportDir, exporter.Filename()))
-	}
-	exportCards := func() error {
-		exporter := csv.NewPlayerCardsExporter()
-		return exportWithFeedback(exporterFunc(exporter), dataDir, player, "player cards", exportTargetFile(exportDir, exporter.Filename()))
-	}
-
-	switch exportType {
-	case "summary":
-		return exportSummary()
-	case "cards":
-		return exportCards()
-	case "all":
-		if err := exportSummary(); err != nil {
+	for _, export := range playerExportTypes[exportType] {
+		if err := export(dataDir, exportDir, player); err != nil {
 			return err
 		}
-		return exportCards()
-	default:
-		return nil
 	}
+	return nil
+}
+
+func exportPlayerSummary(dataDir, exportDir string, player *clashroyale.Player) error {
+	exporter := csv.NewPlayerExporter()
+	return exportWithFeedback(exporterFunc(exporter), dataDir, player, "player summary", exportTargetFile(exportDir, exporter.Filename()))
+}
+
+func exportPlayerCards(dataDir, exportDir string, player *clashroyale.Player) error {
+	exporter := csv.NewPlayerCardsExporter()
+	return exportWithFeedback(exporterFunc(exporter), dataDir, player, "player cards", exportTargetFile(exportDir, exporter.Filename()))
 }
 
 func exportPlayerCommand() *cli.Command {
@@ -123,6 +135,12 @@ func exportPlayerCommand() *cli.Command {
 				return err
 			}
 
+			// Skip the API round-trip when no requested type produces a file
+			if !hasPlayerExportType(types) {
+				printf("No supported export types requested (%s); nothing to export\n", strings.Join(types, ","))
+				return nil
+			}
+
 			// Get player information
 			player, err := client.GetPlayerWithContext(ctx, tag)
 			if err != nil {
@@ -344,58 +362,85 @@ type exportAllData struct {
 	battles  []clashroyale.Battle
 }
 
-func loadExportAllData(ctx context.Context, client *clashroyale.Client, tag string) (exportAllData, error) {
-	player, err := client.GetPlayerWithContext(ctx, tag)
-	if err != nil {
-		return exportAllData{}, fmt.Errorf("failed to get player data: %w", err)
-	}
+// exportAllRun carries the values shared by every step of one "export all" run,
+// resolved once so all files agree on the same paths and timestamp.
+type exportAllRun struct {
+	dataDir   string
+	paths     *storage.PathBuilder
+	timestamp string
+}
 
-	cardList, err := client.GetCardsWithContext(ctx)
-	if err != nil {
-		return exportAllData{}, fmt.Errorf("failed to get card database: %w", err)
+func newExportAllRun(dataDir, timestamp string) exportAllRun {
+	return exportAllRun{
+		dataDir:   dataDir,
+		paths:     storage.NewPathBuilder(dataDir),
+		timestamp: timestamp,
 	}
+}
 
-	battleLog, err := client.GetPlayerBattleLogWithContext(ctx, tag)
-	if err != nil {
-		return exportAllData{}, fmt.Errorf("failed to get battle log: %w", err)
+// loadExportAllData fetches the player, card database and battle log
+// concurrently; the requests are independent and each is dominated by
+// network latency.
+func loadExportAllData(ctx context.Context, client *clashroyale.Client, tag string) (exportAllData, error) {
+	var (
+		wg         sync.WaitGroup
+		player     *clashroyale.Player
+		cardList   *clashroyale.CardList
+		battleLog  *clashroyale.BattleLogResponse
+		playerErr  error
+		cardsErr   error
+		battlesErr error
+	)
+
+	wg.Go(func() { player, playerErr = client.GetPlayerWithContext(ctx, tag) })
+	wg.Go(func() { cardList, cardsErr = client.GetCardsWithContext(ctx) })
+	wg.Go(func() { battleLog, battlesErr = client.GetPlayerBattleLogWithContext(ctx, tag) })
+	wg.Wait()
+
+	if playerErr != nil {
+		return exportAllData{}, fmt.Errorf("failed to get player data: %w", playerErr)
+	}
+	if cardsErr != nil {
+		return exportAllData{}, fmt.Errorf("failed to get card database: %w", cardsErr)
+	}
+	if battlesErr != nil {
+		return exportAllData{}, fmt.Errorf("failed to get battle log: %w", battlesErr)
 	}
-	battles := []clashroyale.Battle(*battleLog)
 
 	return exportAllData{
 		player:   player,
 		cardList: cardList,
-		battles:  battles,
+		battles:  []clashroyale.Battle(*battleLog),
 	}, nil
 }
 
-func exportAllPlayerData(dataDir string, player *clashroyale.Player, timestamp string) error {
+func exportAllPlayerData(run exportAllRun, player *clashroyale.Player) error {
 	fmt.Println("1. Exporting player data...")
-	pathBuilder := storage.NewPathBuilder(dataDir)
-	playerExportDir := pathBuilder.GetCSVPlayersDir()
+	playerExportDir := run.paths.GetCSVPlayersDir()
 	if err := storage.EnsureDirectory(playerExportDir); err != nil {
 		return fmt.Errorf("failed to create player export directory: %w", err)
 	}
 
 	playerExporter := csv.NewPlayerExporter()
 	playerSummaryFile := exportTargetFile(playerExportDir, playerExporter.Filename())
-	if err := exportWithFeedback(exporterFunc(playerExporter), dataDir, player, "player summary", playerSummaryFile); err != nil {
+	if err := exportWithFeedback(exporterFunc(playerExporter), run.dataDir, player, "player summary", playerSummaryFile); err != nil {
 		return err
 	}
-	timestampedSummaryFile, err := applyTimestampToExport(playerSummaryFile, timestamp)
+	timestampedSummaryFile, err := applyTimestampToExport(playerSummaryFile, run.timestamp)
 	if err != nil {
 		return err
 	}
 
 	playerCardsExporter := csv.NewPlayerCardsExporter()
 	playerCardsFile := exportTargetFile(playerExportDir, playerCardsExporter.Filename())
-	if err := exportWithFeedback(exporterFunc(playerCardsExporter), dataDir, player, "player cards", playerCardsFile); err != nil {
+	if err := exportWithFeedback(exporterFunc(playerCardsExporter), run.dataDir, player, "player cards", playerCardsFile); err != nil {
 		return err
 	}
-	timestampedCardsFile, err := applyTimestampToExport(playerCardsFile, timestamp)
+	timestampedCardsFile, err := applyTimestampToExport(playerCardsFile, run.timestamp)
 	if err != nil {
 		return err
 	}
-	if timestamp != "" {
+	if run.timestamp != "" {
 		printf("   ✓ Timestamped player exports:\n")
 		printf("     - %s\n", timestampedSummaryFile)
 		printf("     - %s\n", timestampedCardsFile)
@@ -404,7 +449,7 @@ func exportAllPlayerData(dataDir string, player *clashroyale.Player, timestamp s
 	return nil
 }
 
-func exportAllAnalysisData(dataDir string, player *clashroyale.Player, timestamp string) error {
+func exportAllAnalysisData(run exportAllRun, player *clashroyale.Player) error {
 	fmt.Println("\n2. Analyzing collection...")
 	options := analysis.DefaultAnalysisOptions()
 	analysisResult, err := analysis.AnalyzeCardCollection(player, options)
@@ -412,53 +457,51 @@ func exportAllAnalysisData(dataDir string, player *clashroyale.Player, timestamp
 		return fmt.Errorf("failed to analyze collection: %w", err)
 	}
 
-	pathBuilder := storage.NewPathBuilder(dataDir)
-	analysisExportDir := pathBuilder.GetCSVAnalysisDir()
+	analysisExportDir := run.paths.GetCSVAnalysisDir()
 	if err := storage.EnsureDirectory(analysisExportDir); err != nil {
 		return fmt.Errorf("failed to create analysis export directory: %w", err)
 	}
 
 	analysisExporter := csv.NewAnalysisExporter()
 	analysisFile := exportTargetFile(analysisExportDir, analysisExporter.Filename())
-	if err := exportWithFeedback(exporterFunc(analysisExporter), dataDir, analysisResult, "collection analysis", analysisFile); err != nil {
+	if err := exportWithFeedback(exporterFunc(analysisExporter), run.dataDir, analysisResult, "collection analysis", analysisFile); err != nil {
 		return err
 	}
-	timestampedAnalysisFile, err := applyTimestampToExport(analysisFile, timestamp)
+	timestampedAnalysisFile, err := applyTimestampToExport(analysisFile, run.timestamp)
 	if err != nil {
 		return err
 	}
-	if timestamp != "" {
+	if run.timestamp != "" {
 		printf("   ✓ Timestamped analysis export: %s\n", timestampedAnalysisFile)
 	}
 
 	return nil
 }
 
-func exportAllBattleData(dataDir string, battles []clashroyale.Battle, timestamp string) error {
+func exportAllBattleData(run exportAllRun, battles []clashroyale.Battle) error {
 	fmt.Println("\n3. Exporting battle log...")
-	pathBuilder := storage.NewPathBuilder(dataDir)
-	battleExportDir := filepath.Join(pathBuilder.GetCSVDir(), storage.CSVBattlesSubdir)
+	battleExportDir := filepath.Join(run.paths.GetCSVDir(), storage.CSVBattlesSubdir)
 	if err := storage.EnsureDirectory(battleExportDir); err != nil {
 		return fmt.Errorf("failed to create battle export directory: %w", err)
 	}
 
 	battleExporter := csv.NewBattleLogExporter()
 	battleLogFile := exportTargetFile(battleExportDir, battleExporter.Filename())
-	if err := exportWithFeedback(exporterFunc(battleExporter), dataDir, battles, fmt.Sprintf("battles (%d records)", len(battles)), battleLogFile); err != nil {
+	if err := exportWithFeedback(exporterFunc(battleExporter), run.dataDir, battles, fmt.Sprintf("battles (%d records)", len(battles)), battleLogFile); err != nil {
 		return err
 	}
-	timestampedBattleFile, err := applyTimestampToExport(battleLogFile, timestamp)
+	timestampedBattleFile, err := applyTimestampToExport(battleLogFile, run.timestamp)
 	if err != nil {
 		return err
 	}
-	if timestamp != "" {
+	if run.timestamp != "" {
 		printf("   ✓ Timestamped battle export: %s\n", timestampedBattleFile)
 	}
 
 	return nil
 }
 
-func exportAllEventData(dataDir string, battles []clashroyale.Battle, timestamp string) error {
+func exportAllEventData(run exportAllRun, battles []clashroyale.Battle) error {
 	fmt.Println("\n4. Extracting event battles...")
 	eventBattles := extractEventBattles(battles)
 
@@ -467,8 +510,7 @@ func exportAllEventData(dataDir string, battles []clashroyale.Battle, timestamp
 		return nil
 	}
 
-	pathBuilder := storage.NewPathBuilder(dataDir)
-	eventExportDir := pathBuilder.GetCSVEventsDir()
+	eventExportDir := run.paths.GetCSVEventsDir()
 	if err := storage.EnsureDirectory(eventExportDir); err != nil {
 		return fmt.Errorf("failed to create event export directory: %w", err)
 	}
@@ -492,7 +534,7 @@ func exportAllEventData(dataDir string, battles []clashroyale.Battle, timestamp
 		filepath.Join(storage.NewPathBuilder(tempDir).GetCSVDir(), storage.CSVBattlesSubdir),
 		eventExporter.Filename(),
 	)
-	eventsFile := appendTimestampToFilename(exportTargetFile(eventExportDir, eventExporter.Filename()), timestamp)
+	eventsFile := appendTimestampToFilename(exportTargetFile(eventExportDir, eventExporter.Filename()), run.timestamp)
 	if err := storage.MoveFile(battlesFile, eventsFile); err != nil {
 		return err
 	}
@@ -500,36 +542,35 @@ func exportAllEventData(dataDir string, battles []clashroyale.Battle, timestamp
 	return nil
 }
 
-func exportAllCardDatabase(dataDir string, cardList *clashroyale.CardList, timestamp string) error {
+func exportAllCardDatabase(run exportAllRun, cardList *clashroyale.CardList) error {
 	fmt.Println("\n5. Exporting card database...")
-	pathBuilder := storage.NewPathBuilder(dataDir)
-	cardExportDir := pathBuilder.GetCSVReferenceDir()
+	cardExportDir := run.paths.GetCSVReferenceDir()
 	if err := storage.EnsureDirectory(cardExportDir); err != nil {
 		return fmt.Errorf("failed to create card export directory: %w", err)
 	}
 
 	cardExporter := csv.NewCardsExporter()
 	cardFile := exportTargetFile(cardExportDir, cardExporter.Filename())
-	if err := exportWithFeedback(exporterFunc(cardExporter), dataDir, cardList.Items, "card database", cardFile); err != nil {
+	if err := exportWithFeedback(exporterFunc(cardExporter), run.dataDir, cardList.Items, "card database", cardFile); err != nil {
 		return err
 	}
-	timestampedCardFile, err := applyTimestampToExport(cardFile, timestamp)
+	timestampedCardFile, err := applyTimestampToExport(cardFile, run.timestamp)
 	if err != nil {
 		return err
 	}
-	if timestamp != "" {
+	if run.timestamp != "" {
 		printf("   ✓ Timestamped card export: %s\n", timestampedCardFile)
 	}
 
 	return nil
 }
 
-func printExportAllSummary(dataDir string, player *clashroyale.Player, battles []clashroyale.Battle) {
+func printExportAllSummary(run exportAllRun, player *clashroyale.Player, battles []clashroyale.Battle) {
 	printf("\n✅ Export complete for %s!\n", player.Name)
 	printf("   Player: %s (%d trophies)\n", player.Name, player.Trophies)
 	printf("   Cards: %d collected\n", len(player.Cards))
 	printf("   Battles: %d recent games\n", len(battles))
-	printf("   Location: %s\n", storage.NewPathBuilder(dataDir).GetCSVDir())
+	printf("   Location: %s\n", run.paths.GetCSVDir())
 }
 
 func exportAllCommand() *cli.Command {
@@ -545,8 +586,7 @@ func exportAllCommand() *cli.Command {
 		},
 		Action: func(ctx context.Context, cmd *cli.Command) error {
 			tag := cmd.String("tag")
-			dataDir := cmd.String("data-dir")
-			timestamp := timestampValue(cmd.Bool("timestamp"))
+			run := newExportAllRun(cmd.String("data-dir"), timestampValue(cmd.Bool("timestamp")))
 
 			client, err := requireAPIClient(cmd, apiClientOptions{})
 			if err != nil {
@@ -560,27 +600,27 @@ func exportAllCommand() *cli.Command {
 				return err
 			}
 
-			if err := exportAllPlayerData(dataDir, exportData.player, timestamp); err != nil {
+			if err := exportAllPlayerData(run, exportData.player); err != nil {
 				return err
 			}
 
-			if err := exportAllAnalysisData(dataDir, exportData.player, timestamp); err != nil {
+			if err := exportAllAnalysisData(run, exportData.player); err != nil {
 				return err
 			}
 
-			if err := exportAllBattleData(dataDir, exportData.battles, timestamp); err != nil {
+			if err := exportAllBattleData(run, exportData.battles); err != nil {
 				return err
 			}
 
-			if err := exportAllEventData(dataDir, exportData.battles, timestamp); err != nil {
+			if err := exportAllEventData(run, exportData.battles); err != nil {
 				return err
 			}
 
-			if err := exportAllCardDatabase(dataDir, exportData.cardList, timestamp); err != nil {
+			if err := exportAllCardDatabase(run, exportData.cardList); err != nil {
 				return err
 			}
 
-			printExportAllSummary(dataDir, exportData.player, exportData.battles)
+			printExportAllSummary(run, exportData.player, exportData.battles)
 			return nil
 		},
 	}
@@ -77,6 +77,26 @@ func TestExportTargetFilePreservesBattleLogFilename(t *testing.T) {
 	}
 }
 
+func TestHasPlayerExportType(t *testing.T) {
+	t.Parallel()
+
+	tests := []struct {
+		types []string
+		want  bool
+	}{
+		{types: []string{"summary"}, want: true},
+		{types: []string{"bogus", "all"}, want: true},
+		{types: []string{"bogus"}, want: false},
+		{types: nil, want: false},
+	}
+
+	for _, tt := range tests {
+		if got := hasPlayerExportType(tt.types); got != tt.want {
+			t.Errorf("hasPlayerExportType(%v) = %v, want %v", tt.types, got, tt.want)
+		}
+	}
+}
+
 func TestExportPlayerCommandRequiresAPIToken(t *testing.T) {
 	t.Setenv(apiTokenEnvVar, "")
 
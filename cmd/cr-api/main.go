@@ -1,10 +1,13 @@
 package main
 
 import (
+	"bufio"
 	"context"
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
+	"strconv"
 	"text/tabwriter"
 
 	"github.com/klauer/clash-royale-api/go/internal/datapath"
@@ -25,6 +28,19 @@ var (
 
 const playstyleArtifactName = "playstyle"
 
+// rarityDisplayOrder is the row order for the rarity breakdown table.
+var rarityDisplayOrder = [...]string{"Common", "Rare", "Epic", "Legendary", "Champion"}
+
+// Row layouts for the tabwriter tables printed by the display helpers.
+const (
+	cardDatabaseRowFormat    = "%s\t%s\t%d\t%s\n"
+	rarityBreakdownRowFormat = "%s\t%d\t%d\t%.1f\t%d\t%d\n"
+	upgradePriorityRowFormat = "%s\t%s\t%d/%d\t%d\t%d\t%.1f\t%s\t%s\n"
+)
+
+// maxUpcomingChests caps how many chest cycle slots are listed.
+const maxUpcomingChests = 10
+
 func main() {
 	// Get default paths
 	defaultDataDir := datapath.AppDirOrFallback()
@@ -188,14 +204,19 @@ func displayUpcomingChests(chests *clashroyale.ChestCycle) {
 	fprintf(w, "Slot\tChest Name\n")
 	fprintf(w, "----\t----------\n")
 
-	for i, chest := range chests.Items {
+	items := chests.Items
+	total := len(items)
+	if total > maxUpcomingChests {
+		items = items[:maxUpcomingChests]
+	}
+	for _, chest := range items {
 		fprintf(w, "%d\t%s\n", chest.Index+1, chest.Name)
-		if i >= 9 { // Show first 10 chests
-			break
-		}
 	}
 
 	flushWriter(w)
+	if total > maxUpcomingChests {
+		printf("  ... and %d more\n", total-maxUpcomingChests)
+	}
 }
 
 func savePlayerData(dataDir string, p *clashroyale.Player) error {
@@ -262,7 +283,7 @@ func displayCards(cards []clashroyale.Card) {
 	fprintf(w, "----\t------\t------\t----\n")
 
 	for _, card := range cards {
-		fprintf(w, "%s\t%s\t%d\t%s\n",
+		fprintf(w, cardDatabaseRowFormat,
 			card.Name,
 			card.Rarity,
 			card.ElixirCost,
@@ -353,47 +374,45 @@ func analyzeCommand(ctx context.Context, cmd *cli.Command) error {
 	return nil
 }
 
-func displayAnalysisHeader(a *analysis.CardAnalysis) {
-	printf("\n╔════════════════════════════════════════════════════════════════════╗\n")
-	printf("║                   CARD COLLECTION ANALYSIS                         ║\n")
-	printf("╚════════════════════════════════════════════════════════════════════╝\n\n")
+func displayAnalysisHeader(out io.Writer, a *analysis.CardAnalysis) {
+	fprintf(out, "\n╔════════════════════════════════════════════════════════════════════╗\n")
+	fprintf(out, "║                   CARD COLLECTION ANALYSIS                         ║\n")
+	fprintf(out, "╚════════════════════════════════════════════════════════════════════╝\n\n")
 
-	printf("Player: %s (%s)\n", a.PlayerName, a.PlayerTag)
-	printf("Analysis Time: %s\n\n", a.AnalysisTime.Format("2006-01-02 15:04:05"))
+	fprintf(out, "Player: %s (%s)\n", a.PlayerName, a.PlayerTag)
+	fprintf(out, "Analysis Time: %s\n\n", a.AnalysisTime.Format("2006-01-02 15:04:05"))
 }
 
-func displayAnalysisSummary(a *analysis.CardAnalysis) {
+func displayAnalysisSummary(out io.Writer, a *analysis.CardAnalysis) {
 	// Display summary
-	printf("Summary:\n")
-	printf("════════\n")
-	printf("Total Cards:        %d\n", a.Summary.TotalCards)
-	printf("Max Level Cards:    %d (%.1f%%)\n", a.Summary.MaxLevelCards, a.Summary.CompletionPercent)
-	printf("Average Level:      %.2f\n", a.Summary.AvgCardLevel)
-	printf("Ready to Upgrade:   %d\n", a.Summary.UpgradableCards)
+	fprintf(out, "Summary:\n")
+	fprintf(out, "════════\n")
+	fprintf(out, "Total Cards:        %d\n", a.Summary.TotalCards)
+	fprintf(out, "Max Level Cards:    %d (%.1f%%)\n", a.Summary.MaxLevelCards, a.Summary.CompletionPercent)
+	fprintf(out, "Average Level:      %.2f\n", a.Summary.AvgCardLevel)
+	fprintf(out, "Ready to Upgrade:   %d\n", a.Summary.UpgradableCards)
 
 	// Calculate cards near max from rarity breakdown
 	cardsNearMax := 0
 	for _, stats := range a.RarityBreakdown {
 		cardsNearMax += stats.CardsNearMax
 	}
-	printf("Near Max (1-2 lvl): %d\n", cardsNearMax)
-	printf("\n")
+	fprintf(out, "Near Max (1-2 lvl): %d\n", cardsNearMax)
+	fprintf(out, "\n")
 }
 
-func displayRarityBreakdown(a *analysis.CardAnalysis) {
+func displayRarityBreakdown(out io.Writer, a *analysis.CardAnalysis) {
 	// Display rarity breakdown
 	if len(a.RarityBreakdown) > 0 {
-		printf("Rarity Breakdown:\n")
-		printf("═════════════════\n")
-		w := tabwriter.NewWriter(os.Stdout, 0, 0, 2, ' ', 0)
+		fprintf(out, "Rarity Breakdown:\n")
+		fprintf(out, "═════════════════\n")
+		w := tabwriter.NewWriter(out, 0, 0, 2, ' ', 0)
 		fprintf(w, "Rarity\tTotal\tMax Lvl\tAvg Lvl\tReady\tNear Max\n")
 		fprintf(w, "──────\t─────\t───────\t───────\t─────\t────────\n")
 
-		// Display in order: Common, Rare, Epic, Legendary, Champion
-		order := []string{"Common", "Rare", "Epic", "Legendary", "Champion"}
-		for _, rarity := range order {
+		for _, rarity := range rarityDisplayOrder {
 			if stats, ok := a.RarityBreakdown[rarity]; ok {
-				fprintf(w, "%s\t%d\t%d\t%.1f\t%d\t%d\n",
+				fprintf(w, rarityBreakdownRowFormat,
 					rarity,
 					stats.TotalCards,
 					stats.MaxLevelCards,
@@ -403,16 +422,16 @@ func displayRarityBreakdown(a *analysis.CardAnalysis) {
 			}
 		}
 		flushWriter(w)
-		printf("\n")
+		fprintf(out, "\n")
 	}
 }
 
-func displayUpgradePriorities(a *analysis.CardAnalysis) {
+func displayUpgradePriorities(out io.Writer, a *analysis.CardAnalysis) {
 	// Display upgrade priorities
 	if len(a.UpgradePriority) > 0 {
-		printf("Upgrade Priorities:\n")
-		printf("═══════════════════\n")
-		w := tabwriter.NewWriter(os.Stdout, 0, 0, 2, ' ', 0)
+		fprintf(out, "Upgrade Priorities:\n")
+		fprintf(out, "═══════════════════\n")
+		w := tabwriter.NewWriter(out, 0, 0, 2, ' ', 0)
 		fprintf(w, "Card\tRarity\tLevel\tOwned\tNeeded\tScore\tPriority\tReasons\n")
 		fprintf(w, "────\t──────\t─────\t─────\t──────\t─────\t────────\t───────\n")
 
@@ -421,11 +440,11 @@ func displayUpgradePriorities(a *analysis.CardAnalysis) {
 			if len(priority.Reasons) > 0 {
 				reasons = priority.Reasons[0]
 				if len(priority.Reasons) > 1 {
-					reasons += fmt.Sprintf(" +%d", len(priority.Reasons)-1)
+					reasons += " +" + strconv.Itoa(len(priority.Reasons)-1)
 				}
 			}
 
-			fprintf(w, "%s\t%s\t%d/%d\t%d\t%d\t%.1f\t%s\t%s\n",
+			fprintf(w, upgradePriorityRowFormat,
 				priority.CardName,
 				priority.Rarity,
 				priority.CurrentLevel,
@@ -438,15 +457,18 @@ func displayUpgradePriorities(a *analysis.CardAnalysis) {
 		}
 		flushWriter(w)
 	} else {
-		printf("No upgrade priorities found.\n")
+		fprintf(out, "No upgrade priorities found.\n")
 	}
 }
 
 func displayAnalysis(a *analysis.CardAnalysis) {
-	displayAnalysisHeader(a)
-	displayAnalysisSummary(a)
-	displayRarityBreakdown(a)
-	displayUpgradePriorities(a)
+	// Buffer the whole report so it reaches stdout in a single write.
+	out := bufio.NewWriter(os.Stdout)
+	displayAnalysisHeader(out, a)
+	displayAnalysisSummary(out, a)
+	displayRarityBreakdown(out, a)
+	displayUpgradePriorities(out, a)
+	flushWriter(out)
 }
 
 func saveAnalysisData(dataDir string, a *analysis.CardAnalysis) error {
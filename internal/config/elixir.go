@@ -1,9 +1,9 @@
 package config
 
-// Elixir-related constants for deck building and scoring
-
 import "slices"
 
+// Elixir-related constants for deck building and scoring
+
 const (
 	// ElixirOptimal is the optimal elixir cost for balanced deck composition
 	// Cards around this cost are generally most flexible and efficient
@@ -174,6 +174,47 @@ var roleGroups = map[CardRole][]string{
 	},
 }
 
+// rolePrecedence orders roles for cards listed in more than one role group;
+// the earliest role wins (for example Heal Spirit resolves to RoleSpellSmall).
+var rolePrecedence = [...]CardRole{
+	RoleWinCondition,
+	RoleBuilding,
+	RoleSpellBig,
+	RoleSpellSmall,
+	RoleSupport,
+	RoleCycle,
+}
+
+// cardRoleIndex inverts roleGroups so role lookups are a single map access.
+var cardRoleIndex = buildCardRoleIndex()
+
+func buildCardRoleIndex() map[string]CardRole {
+	index := make(map[string]CardRole)
+	for _, role := range rolePrecedence {
+		for _, cardName := range roleGroups[role] {
+			if _, exists := index[cardName]; !exists {
+				index[cardName] = role
+			}
+		}
+	}
+	return index
+}
+
+// roleCardSets mirrors roleGroups as sets for constant-time membership checks.
+var roleCardSets = buildRoleCardSets()
+
+func buildRoleCardSets() map[CardRole]map[string]struct{} {
+	sets := make(map[CardRole]map[string]struct{}, len(roleGroups))
+	for role, cards := range roleGroups {
+		set := make(map[string]struct{}, len(cards))
+		for _, cardName := range cards {
+			set[cardName] = struct{}{}
+		}
+		sets[role] = set
+	}
+	return sets
+}
+
 // evolutionRoleOverrides defines cards whose role changes when evolved.
 // When a card is evolved, check this map first before using roleGroups.
 var evolutionRoleOverrides = map[string]CardRole{
@@ -239,23 +280,25 @@ func GetCardRoleWithEvolution(cardName string, evolutionLevel int) CardRole {
 	}
 
 	// Check standard role groups
-	for role, cards := range roleGroups {
-		if slices.Contains(cards, cardName) {
-			return role
-		}
-	}
-	return ""
+	return cardRoleIndex[cardName]
 }
 
-// GetRoleCards returns the list of cards for a given role.
-// Returns nil if the role doesn't exist.
+// GetRoleCards returns a copy of the list of cards for a given role, so callers
+// cannot modify the shared role tables. Returns nil if the role doesn't exist.
 func GetRoleCards(role CardRole) []string {
 	if cards, exists := roleGroups[role]; exists {
-		return cards
+		return slices.Clone(cards)
 	}
 	return nil
 }
 
+// IsRoleCard reports whether cardName is listed in the given role group.
+// Unlike GetCardRole, cards listed under several roles match each of them.
+func IsRoleCard(role CardRole, cardName string) bool {
+	_, exists := roleCardSets[role][cardName]
+	return exists
+}
+
 // GetRoleDescription returns a human-readable description for a card role.
 // Unknown roles return "Unknown role".
 func GetRoleDescription(role CardRole) string {
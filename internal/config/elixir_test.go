@@ -25,3 +25,62 @@ func TestGetRoleDescription(t *testing.T) {
 		})
 	}
 }
+
+func TestGetCardRoleWithEvolution(t *testing.T) {
+	tests := []struct {
+		name           string
+		cardName       string
+		evolutionLevel int
+		want           CardRole
+	}{
+		{name: "win condition", cardName: "Hog Rider", want: RoleWinCondition},
+		{name: "alias", cardName: "The Log", want: RoleSpellSmall},
+		{name: "dual role uses precedence", cardName: "Heal Spirit", want: RoleSpellSmall},
+		{name: "evolution override", cardName: "Barbarian", evolutionLevel: 1, want: RoleSupport},
+		{name: "unknown", cardName: "Unknown Card", want: ""},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := GetCardRoleWithEvolution(tt.cardName, tt.evolutionLevel); got != tt.want {
+				t.Fatalf("GetCardRoleWithEvolution(%q, %d) = %q, want %q", tt.cardName, tt.evolutionLevel, got, tt.want)
+			}
+		})
+	}
+}
+
+func TestIsRoleCard(t *testing.T) {
+	tests := []struct {
+		role     CardRole
+		cardName string
+		want     bool
+	}{
+		{role: RoleWinCondition, cardName: "Hog Rider", want: true},
+		{role: RoleSpellSmall, cardName: "Heal Spirit", want: true},
+		{role: RoleCycle, cardName: "Heal Spirit", want: true},
+		{role: RoleBuilding, cardName: "Hog Rider", want: false},
+		{role: CardRole("invalid"), cardName: "Hog Rider", want: false},
+	}
+
+	for _, tt := range tests {
+		if got := IsRoleCard(tt.role, tt.cardName); got != tt.want {
+			t.Errorf("IsRoleCard(%q, %q) = %v, want %v", tt.role, tt.cardName, got, tt.want)
+		}
+	}
+}
+
+func TestGetRoleCardsReturnsCopy(t *testing.T) {
+	cards := GetRoleCards(RoleCycle)
+	if len(cards) == 0 {
+		t.Fatal("GetRoleCards(RoleCycle) returned no cards")
+	}
+	original := cards[0]
+	cards[0] = "Mutated"
+
+	if got := GetRoleCards(RoleCycle)[0]; got != original {
+		t.Errorf("GetRoleCards() exposed shared table: first card = %q, want %q", got, original)
+	}
+	if !IsRoleCard(RoleCycle, original) {
+		t.Errorf("IsRoleCard(RoleCycle, %q) = false after caller mutation", original)
+	}
+}
@@ -180,6 +180,13 @@ func GetChampionAbilityBonus(cardName string) float64 {
 // It handles case-insensitive input and trims whitespace.
 // Returns empty string if input is empty, otherwise returns TitleCase version.
 func NormalizeRarity(rarity string) string {
+	// Fast path: API payloads already use the canonical spelling, so skip the
+	// lowercase copy that the case-insensitive match below allocates.
+	switch rarity {
+	case "Common", "Rare", "Epic", "Legendary", "Champion":
+		return rarity
+	}
+
 	switch strings.ToLower(strings.TrimSpace(rarity)) {
 	case "common":
 		return "Common"
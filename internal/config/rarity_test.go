@@ -57,6 +57,17 @@ func TestNormalizeRarity(t *testing.T) {
 	}
 }
 
+func TestNormalizeRarityCanonicalInputDoesNotAllocate(t *testing.T) {
+	allocs := testing.AllocsPerRun(100, func() {
+		for _, rarity := range []string{"Common", "Rare", "Epic", "Legendary", "Champion"} {
+			_ = NormalizeRarity(rarity)
+		}
+	})
+	if allocs != 0 {
+		t.Errorf("NormalizeRarity allocated %v times for canonical rarities, want 0", allocs)
+	}
+}
+
 func TestGetRarityWeight(t *testing.T) {
 	tests := []struct {
 		name     string
@@ -73,3 +73,36 @@ func TestWriteToMidWriteError(t *testing.T) {
 		t.Fatal("expected error, got nil")
 	}
 }
+
+func TestWriteStreamToEmitsRowsInOrder(t *testing.T) {
+	t.Parallel()
+
+	var buf bytes.Buffer
+	err := WriteStreamTo(&buf, []string{"N"}, func(write func([]string) error) error {
+		for _, v := range []string{"1", "2", "3"} {
+			if err := write([]string{v}); err != nil {
+				return err
+			}
+		}
+		return nil
+	})
+	if err != nil {
+		t.Fatalf("WriteStreamTo returned error: %v", err)
+	}
+
+	if got, want := buf.String(), "N\n1\n2\n3\n"; got != want {
+		t.Fatalf("WriteStreamTo output = %q, want %q", got, want)
+	}
+}
+
+func TestWriteStreamToPropagatesCallbackError(t *testing.T) {
+	t.Parallel()
+
+	sentinel := errors.New("stop")
+	err := WriteStreamTo(&bytes.Buffer{}, []string{"N"}, func(func([]string) error) error {
+		return sentinel
+	})
+	if !errors.Is(err, sentinel) {
+		t.Fatalf("WriteStreamTo error = %v, want %v", err, sentinel)
+	}
+}
@@ -49,20 +49,18 @@ func battleLogExport(dataDir string, data any) error {
 		return csvTypeMismatchError(reflect.TypeOf([]clashroyale.Battle(nil)), data)
 	}
 
-	rows := makeBattleLogRows(battles)
-	return writeCSVRows(dataDir, storage.CSVBattlesSubdir, "battle_log.csv", battleLogHeaders(), rows)
-}
-
-func makeBattleLogRows(battles []clashroyale.Battle) [][]string {
-	rows := make([][]string, 0, len(battles))
-	for _, battle := range battles {
-		row, ok := battleLogRow(battle)
-		if !ok {
-			continue
+	return writeCSVStream(dataDir, storage.CSVBattlesSubdir, "battle_log.csv", battleLogHeaders(), func(write func([]string) error) error {
+		for _, battle := range battles {
+			row, ok := battleLogRow(battle)
+			if !ok {
+				continue
+			}
+			if err := write(row); err != nil {
+				return err
+			}
 		}
-		rows = append(rows, row)
-	}
-	return rows
+		return nil
+	})
 }
 
 func battleLogRow(battle clashroyale.Battle) ([]string, bool) {
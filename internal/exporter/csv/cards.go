@@ -2,6 +2,7 @@ package csv
 
 import (
 	"fmt"
+	"strconv"
 
 	"github.com/klauer/clash-royale-api/go/internal/storage"
 	"github.com/klauer/clash-royale-api/go/pkg/clashroyale"
@@ -38,19 +39,18 @@ func cardsExport(dataDir string, data any) error {
 	}
 
 	// Prepare CSV rows
-	var rows [][]string
+	rows := make([][]string, 0, len(cards))
 	for _, card := range cards {
-		row := []string{
-			fmt.Sprintf("%d", card.ID),
+		rows = append(rows, []string{
+			strconv.Itoa(card.ID),
 			card.Name,
-			fmt.Sprintf("%d", card.ElixirCost),
+			strconv.Itoa(card.ElixirCost),
 			card.Type,
 			card.Rarity,
-			fmt.Sprintf("%d", card.MaxLevel),
-			fmt.Sprintf("%d", card.MaxEvolutionLevel),
+			strconv.Itoa(card.MaxLevel),
+			strconv.Itoa(card.MaxEvolutionLevel),
 			card.Description,
-		}
-		rows = append(rows, row)
+		})
 	}
 
 	// Create exporter and write to file
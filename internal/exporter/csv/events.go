@@ -3,6 +3,7 @@ package csv
 import (
 	"fmt"
 	"reflect"
+	"strconv"
 
 	"github.com/klauer/clash-royale-api/go/internal/storage"
 	"github.com/klauer/clash-royale-api/go/pkg/events"
@@ -29,14 +30,14 @@ func eventDeckExport(dataDir string, data any) error {
 		return csvTypeMismatchError(reflect.TypeOf((*events.EventDeckCollection)(nil)), data)
 	}
 
-	// Prepare CSV rows
-	var rows [][]string
-
-	for _, deck := range collection.Decks {
-		rows = append(rows, events.EventDeckCSVRow(deck))
-	}
-
-	return writeCSVRows(dataDir, storage.CSVEventsSubdir, "event_decks.csv", eventDeckHeaders(), rows)
+	return writeCSVStream(dataDir, storage.CSVEventsSubdir, "event_decks.csv", eventDeckHeaders(), func(write func([]string) error) error {
+		for _, deck := range collection.Decks {
+			if err := write(events.EventDeckCSVRow(deck)); err != nil {
+				return err
+			}
+		}
+		return nil
+	})
 }
 
 // NewEventBattlesExporter creates a new event battles CSV exporter
@@ -75,36 +76,44 @@ func eventBattlesExport(dataDir string, data any) error {
 		return csvTypeMismatchError(reflect.TypeOf((*events.EventDeckCollection)(nil)), data)
 	}
 
-	// Prepare CSV rows
-	var rows [][]string
-
-	for _, deck := range collection.Decks {
-		for _, battle := range deck.Battles {
-			// Format trophy change
-			trophyChange := ""
-			if battle.TrophyChange != nil {
-				trophyChange = fmt.Sprintf("%d", *battle.TrophyChange)
+	return writeCSVStream(dataDir, storage.CSVEventsSubdir, "event_battles.csv", eventBattlesHeaders(), func(write func([]string) error) error {
+		for i := range collection.Decks {
+			if err := writeEventBattleRows(write, &collection.Decks[i]); err != nil {
+				return err
 			}
+		}
+		return nil
+	})
+}
 
-			row := []string{
-				deck.EventID,
-				deck.PlayerTag,
-				battle.Timestamp.Format("2006-01-02 15:04:05"),
-				battle.OpponentTag,
-				battle.OpponentName,
-				battle.Result,
-				fmt.Sprintf("%d", battle.Crowns),
-				fmt.Sprintf("%d", battle.OpponentCrowns),
-				trophyChange,
-				battle.BattleMode,
-				battle.PlayerDeckHash,
-				battle.OpponentDeckHash,
-				fmt.Sprintf("%v", battle.PlayerDeck),
-				fmt.Sprintf("%v", battle.OpponentDeck),
-			}
-			rows = append(rows, row)
+// writeEventBattleRows emits one CSV row per battle played with the deck.
+func writeEventBattleRows(write func([]string) error, deck *events.EventDeck) error {
+	for _, battle := range deck.Battles {
+		// Format trophy change
+		trophyChange := ""
+		if battle.TrophyChange != nil {
+			trophyChange = strconv.Itoa(*battle.TrophyChange)
 		}
-	}
 
-	return writeCSVRows(dataDir, storage.CSVEventsSubdir, "event_battles.csv", eventBattlesHeaders(), rows)
+		row := []string{
+			deck.EventID,
+			deck.PlayerTag,
+			battle.Timestamp.Format("2006-01-02 15:04:05"),
+			battle.OpponentTag,
+			battle.OpponentName,
+			battle.Result,
+			strconv.Itoa(battle.Crowns),
+			strconv.Itoa(battle.OpponentCrowns),
+			trophyChange,
+			battle.BattleMode,
+			battle.PlayerDeckHash,
+			battle.OpponentDeckHash,
+			fmt.Sprintf("%v", battle.PlayerDeck),
+			fmt.Sprintf("%v", battle.OpponentDeck),
+		}
+		if err := write(row); err != nil {
+			return err
+		}
+	}
+	return nil
 }
@@ -19,9 +19,11 @@ func (e *BaseExporter) writeCSV(filePath string, headers []string, rows [][]stri
 	return csvutil.Write(filePath, headers, rows)
 }
 
+// csvFilePath returns the export file path under the given CSV subdirectory,
+// joining and cleaning all path segments in a single pass.
 func (e *BaseExporter) csvFilePath(dataDir, subdir string) string {
 	pathBuilder := storage.NewPathBuilder(dataDir)
-	return filepath.Join(pathBuilder.GetCSVDir(), subdir, e.FilenameBase)
+	return filepath.Join(pathBuilder.BaseDir, storage.CSVDir, subdir, e.FilenameBase)
 }
 
 // writeCSVInSubdir writes CSV data to the export file under the given CSV subdirectory.
@@ -86,3 +88,10 @@ func writeCSVRows(dataDir, subdir, filename string, headers []string, rows [][]s
 	exporter := &BaseExporter{FilenameBase: filename}
 	return exporter.writeCSVInSubdir(dataDir, subdir, headers, rows)
 }
+
+// writeCSVStream writes headers and the rows emitted by writeRows to the export
+// file under the given CSV subdirectory without buffering the full row set.
+func writeCSVStream(dataDir, subdir, filename string, headers []string, writeRows func(write func([]string) error) error) error {
+	exporter := &BaseExporter{FilenameBase: filename}
+	return csvutil.WriteStream(exporter.csvFilePath(dataDir, subdir), headers, writeRows)
+}
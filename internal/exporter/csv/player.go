@@ -79,7 +79,7 @@ func playerExport(dataDir string, data any) error {
 func playerCSVRow(player *clashroyale.Player) []string {
 	winRate := ratio(player.Wins, player.BattleCount)
 	threeCrownRate := ratio(player.ThreeCrownWins, player.BattleCount)
-	return []string{
+	row := []string{
 		player.Tag,
 		player.Name,
 		strconv.FormatBool(player.NameSet),
@@ -102,14 +102,10 @@ func playerCSVRow(player *clashroyale.Player) []string {
 		strconv.Itoa(player.Level),
 		strconv.Itoa(player.Experience),
 		player.Role,
-		clanString(player.Clan, func(c *clashroyale.Clan) string { return c.Tag }),
-		clanString(player.Clan, func(c *clashroyale.Clan) string { return c.Name }),
-		clanString(player.Clan, func(c *clashroyale.Clan) string { return strconv.Itoa(c.ClanScore) }),
-		clanString(player.Clan, func(c *clashroyale.Clan) string { return strconv.Itoa(c.Donations) }),
-		clanString(player.Clan, func(c *clashroyale.Clan) string { return strconv.Itoa(c.BadgeID) }),
-		clanString(player.Clan, func(c *clashroyale.Clan) string { return c.Type }),
-		clanString(player.Clan, func(c *clashroyale.Clan) string { return strconv.Itoa(c.Members) }),
-		clanString(player.Clan, func(c *clashroyale.Clan) string { return strconv.Itoa(c.RequiredTrophies) }),
+	}
+	clan := clanColumns(player.Clan)
+	row = append(row, clan[:]...)
+	return append(row,
 		strconv.Itoa(player.Arena.ID),
 		player.Arena.Name,
 		strconv.Itoa(player.Arena.TrophyLimit),
@@ -121,14 +117,24 @@ func playerCSVRow(player *clashroyale.Player) []string {
 		formatDeckCards(player.Cards),
 		formatDeckCards(player.CurrentDeck),
 		player.CreatedAt.Format("2006-01-02 15:04:05"),
-	}
+	)
 }
 
-func clanString(clan *clashroyale.Clan, extract func(*clashroyale.Clan) string) string {
+// clanColumns returns the clan CSV columns, or blanks when the player has no clan.
+func clanColumns(clan *clashroyale.Clan) [8]string {
 	if clan == nil {
-		return ""
+		return [8]string{}
+	}
+	return [8]string{
+		clan.Tag,
+		clan.Name,
+		strconv.Itoa(clan.ClanScore),
+		strconv.Itoa(clan.Donations),
+		strconv.Itoa(clan.BadgeID),
+		clan.Type,
+		strconv.Itoa(clan.Members),
+		strconv.Itoa(clan.RequiredTrophies),
 	}
-	return extract(clan)
 }
 
 func ratio(value, total int) float64 {
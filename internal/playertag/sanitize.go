@@ -2,12 +2,9 @@ package playertag
 
 import (
 	"fmt"
-	"regexp"
 	"strings"
 )
 
-var pattern = regexp.MustCompile(`^[A-Za-z0-9]+$`)
-
 // Sanitize validates and canonicalizes a player tag for storage and display.
 // It trims whitespace, removes leading '#', enforces alnum chars, and uppercases.
 func Sanitize(playerTag string) (string, error) {
@@ -15,7 +12,7 @@ func Sanitize(playerTag string) (string, error) {
 	if tag == "" {
 		return "", fmt.Errorf("player tag is required")
 	}
-	if !pattern.MatchString(tag) {
+	if !isAlnum(tag) {
 		return "", fmt.Errorf("invalid player tag: must contain only letters and digits")
 	}
 	return strings.ToUpper(tag), nil
@@ -29,3 +26,15 @@ func Display(playerTag string) (string, error) {
 	}
 	return "#" + tag, nil
 }
+
+// isAlnum reports whether s consists solely of ASCII letters and digits.
+// A byte scan avoids running the regexp engine for every tag.
+func isAlnum(s string) bool {
+	for i := 0; i < len(s); i++ {
+		c := s[i]
+		if (c < '0' || c > '9') && (c < 'A' || c > 'Z') && (c < 'a' || c > 'z') {
+			return false
+		}
+	}
+	return true
+}
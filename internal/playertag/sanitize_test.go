@@ -18,6 +18,12 @@ func TestSanitize(t *testing.T) {
 			t.Fatal("expected error for invalid player tag")
 		}
 	})
+
+	t.Run("rejects non-ASCII letters", func(t *testing.T) {
+		if _, err := Sanitize("ABCÉ12"); err == nil {
+			t.Fatal("expected error for non-ASCII player tag")
+		}
+	})
 }
 
 func TestDisplay(t *testing.T) {
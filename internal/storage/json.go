@@ -4,6 +4,7 @@ package storage
 
 import (
 	"encoding/json"
+	"errors"
 	"fmt"
 	"os"
 	"path/filepath"
@@ -12,7 +13,9 @@ import (
 var renameFile = os.Rename
 
 // WriteJSON writes data to a JSON file with pretty formatting (2-space indentation)
-// Creates parent directories if they don't exist
+// Creates parent directories if they don't exist. The payload is written to a
+// temporary sibling and renamed into place, so readers never see a partial file.
+// The file always ends up with mode 0644; the process umask is not applied.
 func WriteJSON(filePath string, data any) error {
 	// Ensure parent directory exists
 	dir := filepath.Dir(filePath)
@@ -27,13 +30,35 @@ func WriteJSON(filePath string, data any) error {
 	}
 
 	// Write to file
-	if err := os.WriteFile(filePath, jsonData, 0o644); err != nil {
+	if err := writeFileAtomic(filePath, jsonData); err != nil {
 		return fmt.Errorf("failed to write file %s: %w", filePath, err)
 	}
 
 	return nil
 }
 
+// writeFileAtomic writes data to a temporary file in the destination directory
+// with a single write, then renames it over filePath.
+func writeFileAtomic(filePath string, data []byte) error {
+	tmp, err := os.CreateTemp(filepath.Dir(filePath), "."+filepath.Base(filePath)+".*.tmp")
+	if err != nil {
+		return err
+	}
+	tmpPath := tmp.Name()
+
+	_, writeErr := tmp.Write(data)
+	if err := errors.Join(writeErr, tmp.Close()); err != nil {
+		return errors.Join(err, os.Remove(tmpPath))
+	}
+	if err := os.Chmod(tmpPath, 0o644); err != nil {
+		return errors.Join(err, os.Remove(tmpPath))
+	}
+	if err := renameFile(tmpPath, filePath); err != nil {
+		return errors.Join(err, os.Remove(tmpPath))
+	}
+	return nil
+}
+
 // ReadJSON reads and unmarshals a JSON file into the provided data structure
 func ReadJSON(filePath string, data any) error {
 	// Read file contents
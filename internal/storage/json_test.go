@@ -135,6 +135,42 @@ func TestWriteJSON_PrettyFormatting(t *testing.T) {
 	}
 }
 
+func TestWriteJSON_ReplacesFileWithoutLeavingTemp(t *testing.T) {
+	dir := t.TempDir()
+	tempFile := filepath.Join(dir, "atomic.json")
+
+	if err := WriteJSON(tempFile, map[string]int{"version": 1}); err != nil {
+		t.Fatalf("WriteJSON() error = %v", err)
+	}
+	if err := WriteJSON(tempFile, map[string]int{"version": 2}); err != nil {
+		t.Fatalf("WriteJSON() overwrite error = %v", err)
+	}
+
+	var got map[string]int
+	if err := ReadJSON(tempFile, &got); err != nil {
+		t.Fatalf("ReadJSON() error = %v", err)
+	}
+	if got["version"] != 2 {
+		t.Errorf("version = %d, want 2", got["version"])
+	}
+
+	info, err := os.Stat(tempFile)
+	if err != nil {
+		t.Fatalf("Stat() error = %v", err)
+	}
+	if perm := info.Mode().Perm(); perm != 0o644 {
+		t.Errorf("file mode = %o, want 644", perm)
+	}
+
+	entries, err := os.ReadDir(dir)
+	if err != nil {
+		t.Fatalf("ReadDir() error = %v", err)
+	}
+	if len(entries) != 1 {
+		t.Errorf("directory has %d entries, want only the written file", len(entries))
+	}
+}
+
 func TestReadJSON(t *testing.T) {
 	tests := []struct {
 		name     string
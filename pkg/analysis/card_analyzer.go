@@ -92,9 +92,10 @@ func convertCardsToUpgradeInfos(cards []clashroyale.Card) []UpgradeInfo {
 			absMaxLevel = 0 // Let calculator decide default
 		}
 
+		// Reuse the rarity normalized above rather than resolving it again
 		info := CalculateUpgradeInfo(
 			card.Name,
-			card.Rarity,
+			rarity,
 			card.ElixirCost,
 			absLevel,
 			card.Count,
@@ -109,7 +110,7 @@ func convertCardsToUpgradeInfos(cards []clashroyale.Card) []UpgradeInfo {
 
 // buildCardLevelsMap builds CardLevelInfo map from UpgradeInfo slice
 func buildCardLevelsMap(infos []UpgradeInfo) map[string]CardLevelInfo {
-	cardLevels := make(map[string]CardLevelInfo)
+	cardLevels := make(map[string]CardLevelInfo, len(infos))
 	for _, info := range infos {
 		cardLevels[info.CardName] = CardLevelInfo{
 			Name:              info.CardName,
@@ -54,6 +54,28 @@ func CalculateCardsNeeded(currentLevel int, rarity string) int {
 	return config.GetUpgradeCost(currentLevel, rarity)
 }
 
+// CalculateCardsToLevel returns the total cards needed to upgrade from currentLevel to targetLevel
+
+// Rarity lookups are resolved once for the whole range instead of once per level
+
+func CalculateCardsToLevel(currentLevel, targetLevel int, rarity string) int {
+	rarity = config.NormalizeRarity(rarity)
+
+	// Levels outside the unlocked range contribute nothing, matching CalculateCardsNeeded
+
+	startLevel := max(currentLevel, config.GetStartingLevel(rarity))
+
+	endLevel := min(targetLevel, config.GetMaxLevel(rarity))
+
+	total := 0
+
+	for level := startLevel; level < endLevel; level++ {
+		total += config.GetUpgradeCost(level, rarity)
+	}
+
+	return total
+}
+
 // IsMaxLevel checks if a card is at maximum level for its rarity
 
 func IsMaxLevel(currentLevel int, rarity string) bool {
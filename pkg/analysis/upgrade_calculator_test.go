@@ -81,6 +81,35 @@ func TestCalculateCardsNeeded(t *testing.T) {
 	}
 }
 
+// TestCalculateCardsToLevelMatchesPerLevelSum checks the range helper against per-level costs
+func TestCalculateCardsToLevelMatchesPerLevelSum(t *testing.T) {
+	tests := []struct {
+		name    string
+		current int
+		target  int
+		rarity  string
+	}{
+		{"Common partial range", 5, 10, "Common"},
+		{"Epic from below starting level", 1, 9, "Epic"},
+		{"Legendary past max level", 12, 20, "legendary"},
+		{"Target below current", 10, 8, "Rare"},
+		{"Unknown rarity", 5, 10, "Mythic"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			want := 0
+			for level := tt.current; level < tt.target; level++ {
+				want += CalculateCardsNeeded(level, tt.rarity)
+			}
+			if got := CalculateCardsToLevel(tt.current, tt.target, tt.rarity); got != want {
+				t.Errorf("CalculateCardsToLevel(%d, %d, %q) = %d, want %d",
+					tt.current, tt.target, tt.rarity, got, want)
+			}
+		})
+	}
+}
+
 // TestGetMaxLevel tests max level retrieval
 func TestGetMaxLevel(t *testing.T) {
 	tests := []struct {
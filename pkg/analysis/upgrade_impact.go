@@ -661,27 +661,12 @@ var upgradeImpactRoleOverrides = map[string]config.CardRole{
 	"Goblin Drill": config.RoleWinCondition,
 }
 
-var upgradeImpactRolePrecedence = []config.CardRole{
-	config.RoleWinCondition,
-	config.RoleBuilding,
-	config.RoleSpellBig,
-	config.RoleSpellSmall,
-	config.RoleSupport,
-	config.RoleCycle,
-}
-
 func (a *UpgradeImpactAnalyzer) inferRole(cardName string) string {
 	if override, exists := upgradeImpactRoleOverrides[cardName]; exists {
 		return override.String()
 	}
 
-	for _, role := range upgradeImpactRolePrecedence {
-		if slices.Contains(config.GetRoleCards(role), cardName) {
-			return role.String()
-		}
-	}
-
-	// Alias fallback (for example "The Log" -> "Log").
+	// Shared role index (handles dual-role precedence and aliases such as "The Log").
 	if role := config.GetCardRole(cardName); role != "" {
 		return role.String()
 	}
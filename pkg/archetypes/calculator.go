@@ -113,15 +113,7 @@ func getRoleWeight(roleStr string) float64 {
 // calculateCardsToLevel calculates total cards needed from currentLevel to targetLevel.
 // Uses the existing upgrade calculator from the analysis package.
 func calculateCardsToLevel(currentLevel, targetLevel int, rarity string) int {
-	if currentLevel >= targetLevel {
-		return 0
-	}
-
-	total := 0
-	for level := currentLevel; level < targetLevel; level++ {
-		total += analysis.CalculateCardsNeeded(level, rarity)
-	}
-	return total
+	return analysis.CalculateCardsToLevel(currentLevel, targetLevel, rarity)
 }
 
 // calculateAvgLevel calculates average card level for a deck.
@@ -526,14 +526,24 @@ func (b *Builder) LoadLatestAnalysis(playerTag, analysisDir string) (*CardAnalys
 		return nil, fmt.Errorf("no analysis files found for player %s", playerTag)
 	}
 
-	// Sort by modification time (newest first)
-	sort.Slice(matches, func(i, j int) bool {
-		infoI, _ := os.Stat(matches[i])
-		infoJ, _ := os.Stat(matches[j])
-		return infoI.ModTime().After(infoJ.ModTime())
-	})
+	return b.LoadAnalysis(newestFile(matches))
+}
 
-	return b.LoadAnalysis(matches[0])
+// newestFile returns the most recently modified path, statting each file once.
+// Files that cannot be statted are only chosen if none can.
+func newestFile(paths []string) string {
+	newest := paths[0]
+	var newestTime time.Time
+	for _, path := range paths {
+		info, err := os.Stat(path)
+		if err != nil {
+			continue
+		}
+		if modTime := info.ModTime(); newestTime.IsZero() || modTime.After(newestTime) {
+			newest, newestTime = path, modTime
+		}
+	}
+	return newest
 }
 
 // SaveDeck persists a deck recommendation to disk
@@ -559,11 +569,25 @@ func (b *Builder) SaveDeck(deckData *DeckRecommendation, outputDir, playerTag st
 
 // Helper methods
 
+// candidateScoring holds scoring inputs that are the same for every card in a build.
+type candidateScoring struct {
+	strategyScaling float64
+	applyFuzzBoost  bool
+}
+
+func (b *Builder) newCandidateScoring() candidateScoring {
+	return candidateScoring{
+		strategyScaling: GetStrategyScaling(),
+		applyFuzzBoost:  b.fuzzIntegration != nil && b.fuzzIntegration.HasStats(),
+	}
+}
+
 func (b *Builder) buildCandidates(cardLevels map[string]CardLevelData) []*CardCandidate {
 	candidates := make([]*CardCandidate, 0, len(cardLevels))
+	scoring := b.newCandidateScoring()
 
 	for name, data := range cardLevels {
-		candidate := b.buildCandidate(name, data)
+		candidate := b.buildScoredCandidate(name, data, scoring)
 		candidates = append(candidates, candidate)
 	}
 
@@ -571,6 +595,10 @@ func (b *Builder) buildCandidates(cardLevels map[string]CardLevelData) []*CardCa
 }
 
 func (b *Builder) buildCandidate(name string, data CardLevelData) *CardCandidate {
+	return b.buildScoredCandidate(name, data, b.newCandidateScoring())
+}
+
+func (b *Builder) buildScoredCandidate(name string, data CardLevelData, scoring candidateScoring) *CardCandidate {
 	level := data.Level
 	maxLevel := data.MaxLevel
 	if maxLevel == 0 {
@@ -610,7 +638,7 @@ func (b *Builder) buildCandidate(name string, data CardLevelData) *CardCandidate
 	}
 
 	// Calculate score using strategy-aware scoring
-	score := ScoreCardWithStrategy(candidate, role, b.strategyConfig, b.levelCurve)
+	score := scoreCardWithStrategyScaling(candidate, role, b.strategyConfig, b.levelCurve, scoring.strategyScaling)
 
 	// Apply archetype-preferred card boost (if any)
 	if data.ScoreBoost > 0 {
@@ -618,7 +646,7 @@ func (b *Builder) buildCandidate(name string, data CardLevelData) *CardCandidate
 	}
 
 	// Apply fuzz boost if available
-	if b.fuzzIntegration != nil && b.fuzzIntegration.HasStats() {
+	if scoring.applyFuzzBoost {
 		score = b.fuzzIntegration.ApplyFuzzBoost(score, name)
 	}
 
@@ -837,17 +865,11 @@ func (b *Builder) clearSynergyCache() {
 
 func (b *Builder) pickBest(role CardRole, candidates []*CardCandidate, used map[string]bool, currentDeck []*CardCandidate) *CardCandidate {
 	// Convert deck.CardRole to config.CardRole
-	roleCards := config.GetRoleCards(config.CardRole(role))
-	if roleCards == nil {
-		return nil
-	}
+	configRole := config.CardRole(role)
 
-	var pool []*CardCandidate
-	for _, candidate := range candidates {
-		if !used[candidate.Name] && b.contains(roleCards, candidate.Name) {
-			pool = append(pool, cloneCardCandidate(candidate))
-		}
-	}
+	pool := cloneCandidatePool(candidates, func(candidate *CardCandidate) bool {
+		return !used[candidate.Name] && config.IsRoleCard(configRole, candidate.Name)
+	})
 
 	if len(pool) == 0 {
 		return nil
@@ -855,61 +877,38 @@ func (b *Builder) pickBest(role CardRole, candidates []*CardCandidate, used map[
 
 	b.applyContextualScoring(pool, currentDeck)
 
-	// Return highest scoring card
-	sort.Slice(pool, func(i, j int) bool {
-		return pool[i].Score > pool[j].Score
-	})
-
-	return pool[0]
+	// Return highest scoring card; a linear scan is enough, no need to sort
+	best := pool[0]
+	for _, candidate := range pool[1:] {
+		if candidate.Score > best.Score {
+			best = candidate
+		}
+	}
+	return best
 }
 
 func (b *Builder) pickMany(role CardRole, candidates []*CardCandidate, used map[string]bool, count int, currentDeck []*CardCandidate) []*CardCandidate {
 	// Convert deck.CardRole to config.CardRole
-	roleCards := config.GetRoleCards(config.CardRole(role))
-	if roleCards == nil {
-		return nil
-	}
-
-	var pool []*CardCandidate
-	for _, candidate := range candidates {
-		if !used[candidate.Name] && b.contains(roleCards, candidate.Name) {
-			pool = append(pool, cloneCardCandidate(candidate))
-		}
-	}
-
-	b.applyContextualScoring(pool, currentDeck)
+	configRole := config.CardRole(role)
 
-	sort.Slice(pool, func(i, j int) bool {
-		return pool[i].Score > pool[j].Score
+	pool := cloneCandidatePool(candidates, func(candidate *CardCandidate) bool {
+		return !used[candidate.Name] && config.IsRoleCard(configRole, candidate.Name)
 	})
 
-	if len(pool) < count {
-		return pool
-	}
+	b.applyContextualScoring(pool, currentDeck)
 
-	return pool[:count]
+	return topScoredCandidates(pool, count)
 }
 
 //nolint:gocyclo // Selection logic intentionally branches on availability/constraints.
 func (b *Builder) getHighestScoreCards(candidates []*CardCandidate, used map[string]bool, count int, currentDeck []*CardCandidate) []*CardCandidate {
-	var pool []*CardCandidate
-	for _, candidate := range candidates {
-		if !used[candidate.Name] {
-			pool = append(pool, cloneCardCandidate(candidate))
-		}
-	}
-
-	b.applyContextualScoring(pool, currentDeck)
-
-	sort.Slice(pool, func(i, j int) bool {
-		return pool[i].Score > pool[j].Score
+	pool := cloneCandidatePool(candidates, func(candidate *CardCandidate) bool {
+		return !used[candidate.Name]
 	})
 
-	if len(pool) < count {
-		return pool
-	}
+	b.applyContextualScoring(pool, currentDeck)
 
-	return pool[:count]
+	return topScoredCandidates(pool, count)
 }
 
 //nolint:gocyclo // Contextual scoring combines optional subsystems (synergy, uniqueness, archetype avoidance).
@@ -949,6 +948,48 @@ func (b *Builder) applyContextualScoring(pool, currentDeck []*CardCandidate) {
 	}
 }
 
+// topScoredCandidates reorders pool so its count highest-scoring candidates
+// come first, best first, and returns them. Only those count positions are
+// selected, so picking a couple of cards does not sort the whole pool.
+func topScoredCandidates(pool []*CardCandidate, count int) []*CardCandidate {
+	count = max(min(count, len(pool)), 0)
+	for i := range count {
+		best := i
+		for j := i + 1; j < len(pool); j++ {
+			if pool[j].Score > pool[best].Score {
+				best = j
+			}
+		}
+		pool[i], pool[best] = pool[best], pool[i]
+	}
+	return pool[:count]
+}
+
+// cloneCandidatePool copies the candidates accepted by keep so contextual
+// scoring can adjust their scores. The copies share one backing array instead
+// of being allocated one by one.
+func cloneCandidatePool(candidates []*CardCandidate, keep func(*CardCandidate) bool) []*CardCandidate {
+	n := 0
+	for _, candidate := range candidates {
+		if keep(candidate) {
+			n++
+		}
+	}
+	if n == 0 {
+		return nil
+	}
+
+	backing := make([]CardCandidate, n)
+	pool := make([]*CardCandidate, 0, n)
+	for _, candidate := range candidates {
+		if keep(candidate) {
+			backing[len(pool)] = *candidate
+			pool = append(pool, &backing[len(pool)])
+		}
+	}
+	return pool
+}
+
 func cloneCardCandidate(candidate *CardCandidate) *CardCandidate {
 	if candidate == nil {
 		return nil
@@ -992,10 +1033,6 @@ func (b *Builder) addStrategicNotes(recommendation *DeckRecommendation) {
 
 // Utility functions
 
-func (b *Builder) contains(slice []string, item string) bool {
-	return slices.Contains(slice, item)
-}
-
 func roundToTwo(value float64) float64 {
 	return float64(int(value*100)) / 100
 }
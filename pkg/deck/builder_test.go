@@ -6,6 +6,7 @@ import (
 	"path/filepath"
 	"strings"
 	"testing"
+	"time"
 )
 
 func TestBuilder_BuildDeckFromAnalysis(t *testing.T) {
@@ -2301,3 +2302,71 @@ func TestBuilder_EnforceChampionLimit(t *testing.T) {
 	t.Logf("Deck champions: %v (count=%d)", championNames, championCount)
 	t.Logf("Deck: %v", deck.Deck)
 }
+
+func TestCloneCandidatePoolCopiesKeptCandidates(t *testing.T) {
+	candidates := []*CardCandidate{
+		{Name: "Knight", Score: 1.0},
+		{Name: "Archers", Score: 2.0},
+		{Name: "Fireball", Score: 3.0},
+	}
+
+	pool := cloneCandidatePool(candidates, func(c *CardCandidate) bool {
+		return c.Name != "Archers"
+	})
+	if len(pool) != 2 || pool[0].Name != "Knight" || pool[1].Name != "Fireball" {
+		t.Fatalf("cloneCandidatePool() = %+v, want Knight and Fireball in order", pool)
+	}
+
+	pool[0].Score += 10
+	if candidates[0].Score != 1.0 {
+		t.Errorf("mutating the pool changed the source candidate score to %v", candidates[0].Score)
+	}
+
+	if got := cloneCandidatePool(candidates, func(*CardCandidate) bool { return false }); got != nil {
+		t.Errorf("cloneCandidatePool() with no matches = %+v, want nil", got)
+	}
+}
+
+func TestNewestFilePicksMostRecentlyModified(t *testing.T) {
+	dir := t.TempDir()
+	older := filepath.Join(dir, "older.json")
+	newer := filepath.Join(dir, "newer.json")
+	for _, path := range []string{older, newer} {
+		if err := os.WriteFile(path, []byte("{}"), 0o644); err != nil {
+			t.Fatalf("WriteFile(%s) error = %v", path, err)
+		}
+	}
+	base := time.Now().Add(-time.Hour)
+	if err := os.Chtimes(older, base, base); err != nil {
+		t.Fatalf("Chtimes(older) error = %v", err)
+	}
+	if err := os.Chtimes(newer, base.Add(time.Minute), base.Add(time.Minute)); err != nil {
+		t.Fatalf("Chtimes(newer) error = %v", err)
+	}
+
+	missing := filepath.Join(dir, "missing.json")
+	if got := newestFile([]string{missing, older, newer}); got != newer {
+		t.Errorf("newestFile() = %q, want %q", got, newer)
+	}
+}
+
+func TestTopScoredCandidatesReturnsHighestFirst(t *testing.T) {
+	pool := []*CardCandidate{
+		{Name: "Knight", Score: 1.0},
+		{Name: "Fireball", Score: 3.0},
+		{Name: "Archers", Score: 2.0},
+		{Name: "Zap", Score: 0.5},
+	}
+
+	top := topScoredCandidates(pool, 2)
+	if len(top) != 2 || top[0].Name != "Fireball" || top[1].Name != "Archers" {
+		t.Fatalf("topScoredCandidates(2) = %+v, want Fireball then Archers", top)
+	}
+
+	if got := topScoredCandidates(pool, 10); len(got) != len(pool) {
+		t.Errorf("topScoredCandidates(10) returned %d cards, want %d", len(got), len(pool))
+	}
+	if got := topScoredCandidates(pool, 0); len(got) != 0 {
+		t.Errorf("topScoredCandidates(0) returned %d cards, want 0", len(got))
+	}
+}
@@ -199,32 +199,32 @@ func findReplacements(
 	return replacements
 }
 
+// commonAlternatives is a hardcoded set of common alternatives per card.
+// This should be replaced with actual card database lookup
+var commonAlternatives = map[string][]string{
+	"Knight":         {"Valkyrie", "Ice Golem", "Dark Prince"},
+	"Hog Rider":      {"Ram Rider", "Battle Ram", "Royal Hogs"},
+	"Fireball":       {"Poison", "Lightning", "Rocket"},
+	"Zap":            {"The Log", "Arrows", "Giant Snowball"},
+	"Musketeer":      {"Hunter", "Magic Archer", "Flying Machine"},
+	"Mega Minion":    {"Minions", "Bats", "Minion Horde"},
+	"Ice Spirit":     {"Fire Spirit", "Heal Spirit", "Electro Spirit"},
+	"Tesla":          {"Cannon", "Inferno Tower", "Bomb Tower"},
+	"Prince":         {"Dark Prince", "Mini P.E.K.K.A", "Valkyrie"},
+	"Goblin Gang":    {"Skeleton Army", "Guards", "Rascals"},
+	"Balloon":        {"Lava Hound", "Giant", "Golem"},
+	"Wizard":         {"Executioner", "Baby Dragon", "Witch"},
+	"Giant":          {"Golem", "Royal Giant", "Goblin Giant"},
+	"P.E.K.K.A":      {"Mega Knight", "Golem", "Giant Skeleton"},
+	"Electro Wizard": {"Ice Wizard", "Witch", "Mother Witch"},
+}
+
 // getSimilarCards returns cards similar to the given card (same role or elixir cost)
 func getSimilarCards(card deck.CardCandidate) []deck.CardCandidate {
 	// This is a simplified implementation
 	// In a full implementation, this would query a card database
 	similar := make([]deck.CardCandidate, 0)
 
-	// For now, we'll return a hardcoded set of common alternatives
-	// This should be replaced with actual card database lookup
-	commonAlternatives := map[string][]string{
-		"Knight":         {"Valkyrie", "Ice Golem", "Dark Prince"},
-		"Hog Rider":      {"Ram Rider", "Battle Ram", "Royal Hogs"},
-		"Fireball":       {"Poison", "Lightning", "Rocket"},
-		"Zap":            {"The Log", "Arrows", "Giant Snowball"},
-		"Musketeer":      {"Hunter", "Magic Archer", "Flying Machine"},
-		"Mega Minion":    {"Minions", "Bats", "Minion Horde"},
-		"Ice Spirit":     {"Fire Spirit", "Heal Spirit", "Electro Spirit"},
-		"Tesla":          {"Cannon", "Inferno Tower", "Bomb Tower"},
-		"Prince":         {"Dark Prince", "Mini P.E.K.K.A", "Valkyrie"},
-		"Goblin Gang":    {"Skeleton Army", "Guards", "Rascals"},
-		"Balloon":        {"Lava Hound", "Giant", "Golem"},
-		"Wizard":         {"Executioner", "Baby Dragon", "Witch"},
-		"Giant":          {"Golem", "Royal Giant", "Goblin Giant"},
-		"P.E.K.K.A":      {"Mega Knight", "Golem", "Giant Skeleton"},
-		"Electro Wizard": {"Ice Wizard", "Witch", "Mother Witch"},
-	}
-
 	// Get alternatives for this card
 	altNames, exists := commonAlternatives[card.Name]
 	if !exists {
@@ -317,68 +317,69 @@ func determineImpact(scoreDelta float64) string {
 	}
 }
 
+// inferredElixirCosts holds hardcoded elixir costs for common cards, used by
+// inferElixirForCard.
+var inferredElixirCosts = map[string]int{
+	"Knight":         3,
+	"Valkyrie":       4,
+	"Ice Golem":      2,
+	"Dark Prince":    4,
+	"Hog Rider":      4,
+	"Ram Rider":      5,
+	"Battle Ram":     4,
+	"Royal Hogs":     5,
+	"Fireball":       4,
+	"Poison":         4,
+	"Lightning":      6,
+	"Rocket":         6,
+	"Zap":            2,
+	"The Log":        2,
+	"Arrows":         3,
+	"Giant Snowball": 2,
+	"Musketeer":      4,
+	"Hunter":         4,
+	"Magic Archer":   4,
+	"Flying Machine": 4,
+	"Mega Minion":    3,
+	"Minions":        3,
+	"Bats":           2,
+	"Minion Horde":   5,
+	"Ice Spirit":     1,
+	"Fire Spirit":    1,
+	"Heal Spirit":    1,
+	"Electro Spirit": 1,
+	"Tesla":          4,
+	"Cannon":         3,
+	"Inferno Tower":  5,
+	"Bomb Tower":     4,
+	"Prince":         5,
+	"Mini P.E.K.K.A": 4,
+	"Goblin Gang":    3,
+	"Skeleton Army":  3,
+	"Guards":         3,
+	"Rascals":        5,
+	"Balloon":        5,
+	"Lava Hound":     7,
+	"Giant":          5,
+	"Golem":          8,
+	"Wizard":         5,
+	"Executioner":    5,
+	"Baby Dragon":    4,
+	"Witch":          5,
+	"Royal Giant":    6,
+	"Goblin Giant":   6,
+	"Giant Skeleton": 6,
+	"P.E.K.K.A":      7,
+	"Mega Knight":    7,
+	"Electro Wizard": 4,
+	"Ice Wizard":     3,
+	"Mother Witch":   4,
+}
+
 // inferElixirForCard infers the elixir cost for a card by name
 // This is a simplified version - should use actual card database
 func inferElixirForCard(name string) int {
-	// Hardcoded elixir costs for common cards
-	elixirCosts := map[string]int{
-		"Knight":         3,
-		"Valkyrie":       4,
-		"Ice Golem":      2,
-		"Dark Prince":    4,
-		"Hog Rider":      4,
-		"Ram Rider":      5,
-		"Battle Ram":     4,
-		"Royal Hogs":     5,
-		"Fireball":       4,
-		"Poison":         4,
-		"Lightning":      6,
-		"Rocket":         6,
-		"Zap":            2,
-		"The Log":        2,
-		"Arrows":         3,
-		"Giant Snowball": 2,
-		"Musketeer":      4,
-		"Hunter":         4,
-		"Magic Archer":   4,
-		"Flying Machine": 4,
-		"Mega Minion":    3,
-		"Minions":        3,
-		"Bats":           2,
-		"Minion Horde":   5,
-		"Ice Spirit":     1,
-		"Fire Spirit":    1,
-		"Heal Spirit":    1,
-		"Electro Spirit": 1,
-		"Tesla":          4,
-		"Cannon":         3,
-		"Inferno Tower":  5,
-		"Bomb Tower":     4,
-		"Prince":         5,
-		"Mini P.E.K.K.A": 4,
-		"Goblin Gang":    3,
-		"Skeleton Army":  3,
-		"Guards":         3,
-		"Rascals":        5,
-		"Balloon":        5,
-		"Lava Hound":     7,
-		"Giant":          5,
-		"Golem":          8,
-		"Wizard":         5,
-		"Executioner":    5,
-		"Baby Dragon":    4,
-		"Witch":          5,
-		"Royal Giant":    6,
-		"Goblin Giant":   6,
-		"Giant Skeleton": 6,
-		"P.E.K.K.A":      7,
-		"Mega Knight":    7,
-		"Electro Wizard": 4,
-		"Ice Wizard":     3,
-		"Mother Witch":   4,
-	}
-
-	if cost, exists := elixirCosts[name]; exists {
+	if cost, exists := inferredElixirCosts[name]; exists {
 		return cost
 	}
 
@@ -185,10 +185,11 @@ func formatAnalysisSection(section AnalysisSection) string {
 	return output.String()
 }
 
-// escapeCSV escapes a string for CSV format (handles commas, quotes, newlines)
+// escapeCSV escapes a string for CSV format (handles commas, quotes, newlines).
+// Clean values are returned as-is without allocating.
 func escapeCSV(s string) string {
-	// If string contains comma, quote, or newline, wrap in quotes and escape quotes
-	if strings.ContainsAny(s, ",\"\n") {
+	// If string contains comma, quote, or line break, wrap in quotes and escape quotes
+	if strings.ContainsAny(s, ",\"\r\n") {
 		// Escape quotes by doubling them
 		escaped := strings.ReplaceAll(s, "\"", "\"\"")
 		return "\"" + escaped + "\""
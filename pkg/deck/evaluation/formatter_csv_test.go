@@ -155,6 +155,11 @@ func TestEscapeCSV(t *testing.T) {
 			input:    "Line 1\nLine 2",
 			expected: "\"Line 1\nLine 2\"",
 		},
+		{
+			name:     "Contains carriage return",
+			input:    "Line 1\r\nLine 2",
+			expected: "\"Line 1\r\nLine 2\"",
+		},
 		{
 			name:     "Contains multiple special chars",
 			input:    `Value "with", comma`,
@@ -184,10 +184,7 @@ func (p *DeckProjection) CalculateUpgradePath() *UpgradePath {
 		cardsNeeded := analysis.CalculateTotalCardsToMax(card.Level, card.Rarity)
 		if targetLevel < card.MaxLevel {
 			// Partial upgrade - need to recalculate
-			cardsNeeded = 0
-			for level := card.Level; level < targetLevel; level++ {
-				cardsNeeded += analysis.CalculateCardsNeeded(level, card.Rarity)
-			}
+			cardsNeeded = analysis.CalculateCardsToLevel(card.Level, targetLevel, card.Rarity)
 		}
 
 		// Calculate gold needed
@@ -435,6 +435,12 @@ func ScoreAllCandidatesWithCombat(candidates []CardCandidate) {
 // Applies role bonuses and elixir targeting adjustments based on the strategy
 // Uses curve-based level calculation when available
 func ScoreCardWithStrategy(card *CardCandidate, role *CardRole, strategyConfig StrategyConfig, levelCurve *LevelCurve) float64 {
+	return scoreCardWithStrategyScaling(card, role, strategyConfig, levelCurve, GetStrategyScaling())
+}
+
+// scoreCardWithStrategyScaling is ScoreCardWithStrategy with the strategy bonus
+// scale supplied by the caller, so batch scoring reads it once per build.
+func scoreCardWithStrategyScaling(card *CardCandidate, role *CardRole, strategyConfig StrategyConfig, levelCurve *LevelCurve, strategyScaling float64) float64 {
 	// Start with base score using curve-based calculation (via internal functions with card name)
 	var baseScore float64
 	if card.Stats != nil {
@@ -472,7 +478,7 @@ func ScoreCardWithStrategy(card *CardCandidate, role *CardRole, strategyConfig S
 	if role != nil {
 		// Try additive bonuses first (new system)
 		if bonus, exists := strategyConfig.RoleBonuses[*role]; exists {
-			strategyBonus = bonus * GetStrategyScaling()
+			strategyBonus = bonus * strategyScaling
 		} else if strategyConfig.RoleMultipliers != nil {
 			// Fallback to legacy multiplier system for backward compatibility
 			if mult, exists := strategyConfig.RoleMultipliers[*role]; exists {
@@ -488,7 +494,7 @@ func ScoreCardWithStrategy(card *CardCandidate, role *CardRole, strategyConfig S
 	// Apply archetype affinity bonus (helps on-archetype cards compete with higher-level cards)
 	archetypeBonus := 0.0
 	if affinityBonus, exists := strategyConfig.ArchetypeAffinity[card.Name]; exists {
-		archetypeBonus = affinityBonus * GetStrategyScaling()
+		archetypeBonus = affinityBonus * strategyScaling
 	}
 
 	// Apply elixir targeting adjustment
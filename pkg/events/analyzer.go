@@ -219,13 +219,16 @@ func filterDecksByEventType(decks []EventDeck, eventTypes []string) []EventDeck
 func calculateSummary(decks []EventDeck) EventSummary {
 	summary := EventSummary{}
 
-	for _, deck := range decks {
-		perf := deck.Performance
-		summary.TotalBattles += perf.TotalBattles()
+	for i := range decks {
+		perf := &decks[i].Performance
+		battles := perf.TotalBattles()
+		summary.TotalBattles += battles
 		summary.TotalWins += perf.Wins
 		summary.TotalLosses += perf.Losses
-		summary.AvgCrownsPerBattle += float64(perf.CrownsEarned-perf.CrownsLost) / float64(perf.TotalBattles())
-		summary.AvgDeckElixir += deck.Deck.AvgElixir
+		if battles > 0 {
+			summary.AvgCrownsPerBattle += float64(perf.CrownsEarned-perf.CrownsLost) / float64(battles)
+		}
+		summary.AvgDeckElixir += decks[i].Deck.AvgElixir
 	}
 
 	// Calculate win rate
@@ -244,35 +247,31 @@ func analyzeCardUsage(decks []EventDeck) EventCardAnalysis {
 	cardWins := make(map[string]int)    // card name -> total wins with this card
 	cardBattles := make(map[string]int) // card name -> total battles with this card
 
-	// Track all unique cards seen
-	uniqueCards := make(map[string]bool)
-
-	for _, deck := range decks {
+	for i := range decks {
+		deck := &decks[i]
+		// Battle stats are per deck, so every card in it gets the same totals
+		wins := deck.Performance.Wins
+		battles := deck.Performance.TotalBattles()
 		for _, card := range deck.Deck.Cards {
-			cardName := card.Name
-			cardUsage[cardName]++
-			uniqueCards[cardName] = true
-
-			// Add battle stats for this card
-			cardWins[cardName] += deck.Performance.Wins
-			cardBattles[cardName] += deck.Performance.TotalBattles()
+			cardUsage[card.Name]++
+			cardWins[card.Name] += wins
+			cardBattles[card.Name] += battles
 		}
 	}
 
 	// Convert to slices and sort
-	var mostUsed []CardUsage
+	mostUsed := make([]CardUsage, 0, len(cardUsage))
 	for name, count := range cardUsage {
 		mostUsed = append(mostUsed, CardUsage{CardName: name, Count: count})
 	}
 
-	// Sort by count descending
-	for i := 0; i < len(mostUsed)-1; i++ {
-		for j := i + 1; j < len(mostUsed); j++ {
-			if mostUsed[j].Count > mostUsed[i].Count {
-				mostUsed[i], mostUsed[j] = mostUsed[j], mostUsed[i]
-			}
+	// Sort by count descending (name breaks ties so output is stable)
+	sort.Slice(mostUsed, func(i, j int) bool {
+		if mostUsed[i].Count != mostUsed[j].Count {
+			return mostUsed[i].Count > mostUsed[j].Count
 		}
-	}
+		return mostUsed[i].CardName < mostUsed[j].CardName
+	})
 
 	// Limit top 10 most used cards
 	if len(mostUsed) > 10 {
@@ -292,14 +291,13 @@ func analyzeCardUsage(decks []EventDeck) EventCardAnalysis {
 		}
 	}
 
-	// Sort by win rate descending
-	for i := 0; i < len(highestWinRate)-1; i++ {
-		for j := i + 1; j < len(highestWinRate); j++ {
-			if highestWinRate[j].WinRate > highestWinRate[i].WinRate {
-				highestWinRate[i], highestWinRate[j] = highestWinRate[j], highestWinRate[i]
-			}
+	// Sort by win rate descending (name breaks ties so output is stable)
+	sort.Slice(highestWinRate, func(i, j int) bool {
+		if highestWinRate[i].WinRate != highestWinRate[j].WinRate {
+			return highestWinRate[i].WinRate > highestWinRate[j].WinRate
 		}
-	}
+		return highestWinRate[i].CardName < highestWinRate[j].CardName
+	})
 
 	// Limit top 10 highest win rate cards
 	if len(highestWinRate) > 10 {
@@ -309,61 +307,55 @@ func analyzeCardUsage(decks []EventDeck) EventCardAnalysis {
 	return EventCardAnalysis{
 		MostUsedCards:       mostUsed,
 		HighestWinRateCards: highestWinRate,
-		TotalUniqueCards:    len(uniqueCards),
+		TotalUniqueCards:    len(cardUsage),
 	}
 }
 
+// elixirRangeTotals accumulates deck and battle counts for one elixir range.
+type elixirRangeTotals struct {
+	decks   int
+	wins    int
+	battles int
+}
+
 // analyzeElixirPerformance analyzes performance by deck elixir cost ranges
 func analyzeElixirPerformance(decks []EventDeck) EventElixirAnalysis {
-	var lowDecks, midDecks, highDecks []EventDeck
+	var low, mid, high elixirRangeTotals
 
-	// Categorize decks by average elixir cost
-	for _, deck := range decks {
-		avgElixir := deck.Deck.AvgElixir
-		switch {
+	// Categorize decks by average elixir cost, accumulating totals in one pass
+	for i := range decks {
+		deck := &decks[i]
+		var totals *elixirRangeTotals
+		switch avgElixir := deck.Deck.AvgElixir; {
 		case avgElixir < 3.5:
-			lowDecks = append(lowDecks, deck)
+			totals = &low
 		case avgElixir < 4.5:
-			midDecks = append(midDecks, deck)
+			totals = &mid
 		default:
-			highDecks = append(highDecks, deck)
+			totals = &high
 		}
+		totals.decks++
+		totals.wins += deck.Performance.Wins
+		totals.battles += deck.Performance.TotalBattles()
 	}
 
 	return EventElixirAnalysis{
-		LowElixir:  calculateElixirRangeStats(lowDecks, "Low (0.0-3.4)"),
-		MidElixir:  calculateElixirRangeStats(midDecks, "Mid (3.5-4.4)"),
-		HighElixir: calculateElixirRangeStats(highDecks, "High (4.5+)"),
+		LowElixir:  calculateElixirRangeStats(low, "Low (0.0-3.4)"),
+		MidElixir:  calculateElixirRangeStats(mid, "Mid (3.5-4.4)"),
+		HighElixir: calculateElixirRangeStats(high, "High (4.5+)"),
 	}
 }
 
 // calculateElixirRangeStats computes statistics for decks within an elixir range
-func calculateElixirRangeStats(decks []EventDeck, rangeLabel string) ElixirRangeStats {
-	if len(decks) == 0 {
-		return ElixirRangeStats{
-			Range:      rangeLabel,
-			DeckCount:  0,
-			AvgWinRate: 0,
-		}
-	}
-
-	totalWins := 0
-	totalBattles := 0
-
-	for _, deck := range decks {
-		perf := deck.Performance
-		totalWins += perf.Wins
-		totalBattles += perf.TotalBattles()
-	}
-
+func calculateElixirRangeStats(totals elixirRangeTotals, rangeLabel string) ElixirRangeStats {
 	var avgWinRate float64
-	if totalBattles > 0 {
-		avgWinRate = float64(totalWins) / float64(totalBattles)
+	if totals.battles > 0 {
+		avgWinRate = float64(totals.wins) / float64(totals.battles)
 	}
 
 	return ElixirRangeStats{
 		Range:      rangeLabel,
-		DeckCount:  len(decks),
+		DeckCount:  totals.decks,
 		AvgWinRate: avgWinRate,
 	}
 }
@@ -372,7 +364,8 @@ func calculateElixirRangeStats(decks []EventDeck, rangeLabel string) ElixirRange
 func calculateEventBreakdown(decks []EventDeck) map[string]EventStats {
 	eventStats := make(map[string]EventStats)
 
-	for _, deck := range decks {
+	for i := range decks {
+		deck := &decks[i]
 		eventType := string(deck.EventType)
 		stats, exists := eventStats[eventType]
 		if !exists {
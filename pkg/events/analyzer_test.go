@@ -1,6 +1,7 @@
 package events
 
 import (
+	"math"
 	"testing"
 	"time"
 )
@@ -347,3 +348,44 @@ func TestAnalyzeEventDecks_DeckMatchups_BackfillPlayerDeckHash(t *testing.T) {
 		t.Errorf("PlayerDeck length = %d, want %d", len(top.PlayerDeck), len(playerDeck))
 	}
 }
+
+func TestAnalyzeCardUsage_SortsByCountThenName(t *testing.T) {
+	decks := []EventDeck{
+		createTestEventDeck([]string{"Knight", "Archers", "Zap"}, 3, 1),
+		createTestEventDeck([]string{"Knight", "Bats"}, 1, 2),
+	}
+
+	result := analyzeCardUsage(decks)
+
+	want := []string{"Knight", "Archers", "Bats", "Zap"}
+	if len(result.MostUsedCards) != len(want) {
+		t.Fatalf("MostUsedCards has %d entries, want %d", len(result.MostUsedCards), len(want))
+	}
+	for i, name := range want {
+		if result.MostUsedCards[i].CardName != name {
+			t.Errorf("MostUsedCards[%d] = %q, want %q", i, result.MostUsedCards[i].CardName, name)
+		}
+	}
+	if result.TotalUniqueCards != 4 {
+		t.Errorf("TotalUniqueCards = %d, want 4", result.TotalUniqueCards)
+	}
+	if got := result.HighestWinRateCards[0]; got.CardName != "Archers" || got.WinRate != 0.75 {
+		t.Errorf("HighestWinRateCards[0] = %+v, want Archers at 0.75", got)
+	}
+}
+
+func TestCalculateSummary_SkipsCrownAverageForDecksWithoutBattles(t *testing.T) {
+	played := createTestEventDeck([]string{"Knight"}, 2, 2)
+	played.Performance.CrownsEarned = 6
+	played.Performance.CrownsLost = 2
+	unplayed := createTestEventDeck([]string{"Knight"}, 0, 0)
+
+	summary := calculateSummary([]EventDeck{played, unplayed})
+
+	if math.IsNaN(summary.AvgCrownsPerBattle) {
+		t.Fatal("AvgCrownsPerBattle is NaN")
+	}
+	if summary.AvgCrownsPerBattle != 0.5 {
+		t.Errorf("AvgCrownsPerBattle = %v, want 0.5", summary.AvgCrownsPerBattle)
+	}
+}
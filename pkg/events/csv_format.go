@@ -1,50 +1,50 @@
 package events
 
 import (
-	"fmt"
+	"slices"
+	"strconv"
 	"strings"
+	"time"
 )
 
+// eventDeckCSVHeaders is the canonical column list for event deck exports.
+var eventDeckCSVHeaders = []string{
+	"Event ID",
+	"Player Tag",
+	"Event Name",
+	"Event Type",
+	"Start Time",
+	"End Time",
+	"Deck Cards",
+	"Deck Average Elixir",
+	"Total Battles",
+	"Wins",
+	"Losses",
+	"Win Rate",
+	"Current Streak",
+	"Best Streak",
+	"Crowns Earned",
+	"Crowns Lost",
+	"Event Progress",
+	"Max Wins",
+	"Notes",
+}
+
 // EventDeckCSVHeaders returns the canonical CSV headers for event deck exports.
 func EventDeckCSVHeaders() []string {
-	return []string{
-		"Event ID",
-		"Player Tag",
-		"Event Name",
-		"Event Type",
-		"Start Time",
-		"End Time",
-		"Deck Cards",
-		"Deck Average Elixir",
-		"Total Battles",
-		"Wins",
-		"Losses",
-		"Win Rate",
-		"Current Streak",
-		"Best Streak",
-		"Crowns Earned",
-		"Crowns Lost",
-		"Event Progress",
-		"Max Wins",
-		"Notes",
-	}
+	return slices.Clone(eventDeckCSVHeaders)
 }
 
 // EventDeckCSVRow formats an event deck as a canonical CSV row.
 func EventDeckCSVRow(deck EventDeck) []string {
-	cardNames := make([]string, len(deck.Deck.Cards))
-	for i, card := range deck.Deck.Cards {
-		cardNames[i] = formatDeckCard(card)
-	}
-
 	endTime := ""
 	if deck.EndTime != nil {
-		endTime = deck.EndTime.Format("2006-01-02 15:04:05")
+		endTime = formatCSVTime(*deck.EndTime)
 	}
 
 	maxWins := ""
 	if deck.Performance.MaxWins != nil {
-		maxWins = fmt.Sprintf("%d", *deck.Performance.MaxWins)
+		maxWins = strconv.Itoa(*deck.Performance.MaxWins)
 	}
 
 	return []string{
@@ -52,18 +52,18 @@ func EventDeckCSVRow(deck EventDeck) []string {
 		deck.PlayerTag,
 		deck.EventName,
 		string(deck.EventType),
-		deck.StartTime.Format("2006-01-02 15:04:05"),
+		formatCSVTime(deck.StartTime),
 		endTime,
-		strings.Join(cardNames, " | "),
-		fmt.Sprintf("%.1f", deck.Deck.AvgElixir),
-		fmt.Sprintf("%d", deck.Performance.TotalBattles()),
-		fmt.Sprintf("%d", deck.Performance.Wins),
-		fmt.Sprintf("%d", deck.Performance.Losses),
-		fmt.Sprintf("%.2f", deck.Performance.WinRate),
-		fmt.Sprintf("%d", deck.Performance.CurrentStreak),
-		fmt.Sprintf("%d", deck.Performance.BestStreak),
-		fmt.Sprintf("%d", deck.Performance.CrownsEarned),
-		fmt.Sprintf("%d", deck.Performance.CrownsLost),
+		formatDeckCards(deck.Deck.Cards),
+		strconv.FormatFloat(deck.Deck.AvgElixir, 'f', 1, 64),
+		strconv.Itoa(deck.Performance.TotalBattles()),
+		strconv.Itoa(deck.Performance.Wins),
+		strconv.Itoa(deck.Performance.Losses),
+		strconv.FormatFloat(deck.Performance.WinRate, 'f', 2, 64),
+		strconv.Itoa(deck.Performance.CurrentStreak),
+		strconv.Itoa(deck.Performance.BestStreak),
+		strconv.Itoa(deck.Performance.CrownsEarned),
+		strconv.Itoa(deck.Performance.CrownsLost),
 		string(deck.Performance.Progress),
 		maxWins,
 		deck.Notes,
@@ -72,15 +72,50 @@ func EventDeckCSVRow(deck EventDeck) []string {
 
 // EventTypeSeparatorCSVRow returns a row marker for grouped event exports.
 func EventTypeSeparatorCSVRow(eventType EventType) []string {
-	row := make([]string, len(EventDeckCSVHeaders()))
-	row[0] = fmt.Sprintf("# Event Type: %s", eventType)
+	row := make([]string, len(eventDeckCSVHeaders))
+	row[0] = "# Event Type: " + string(eventType)
 	return row
 }
 
-func formatDeckCard(card CardInDeck) string {
-	if card.EvolutionLevel > 0 {
-		return fmt.Sprintf("%s (Lv.%d Evo.%d)", card.Name, card.Level, card.EvolutionLevel)
+// formatCSVTime renders t as time.DateTime ("2006-01-02 15:04:05") into a
+// stack buffer, so only the returned string is allocated.
+func formatCSVTime(t time.Time) string {
+	var buf [len(time.DateTime)]byte
+	return string(t.AppendFormat(buf[:0], time.DateTime))
+}
+
+// deckCardsSeparator joins the per-card entries of the "Deck Cards" column.
+const deckCardsSeparator = " | "
+
+// formatDeckCards renders every card of a deck into the single "Deck Cards"
+// column, writing straight into one presized buffer rather than formatting
+// each card into its own string and joining them afterwards.
+func formatDeckCards(cards []CardInDeck) string {
+	if len(cards) == 0 {
+		return ""
 	}
 
-	return fmt.Sprintf("%s (Lv.%d)", card.Name, card.Level)
+	size := len(deckCardsSeparator) * (len(cards) - 1)
+	for i := range cards {
+		// name + " (Lv.NN Evo.N)"
+		size += len(cards[i].Name) + 16
+	}
+
+	var b strings.Builder
+	b.Grow(size)
+	for i := range cards {
+		if i > 0 {
+			b.WriteString(deckCardsSeparator)
+		}
+		card := &cards[i]
+		b.WriteString(card.Name)
+		b.WriteString(" (Lv.")
+		b.WriteString(strconv.Itoa(card.Level))
+		if card.EvolutionLevel > 0 {
+			b.WriteString(" Evo.")
+			b.WriteString(strconv.Itoa(card.EvolutionLevel))
+		}
+		b.WriteByte(')')
+	}
+	return b.String()
 }
@@ -57,3 +57,20 @@ func TestEventDeckCSVRow_FormatsDeckCardsAndMaxWins(t *testing.T) {
 		t.Fatalf("max wins = %q, want 12", row[17])
 	}
 }
+
+func TestFormatCSVTimeMatchesTimeFormat(t *testing.T) {
+	times := []time.Time{
+		time.Date(2026, 2, 20, 12, 34, 56, 0, time.UTC),
+		time.Date(2024, 12, 31, 23, 59, 59, 999999999, time.UTC),
+		time.Date(1, 1, 1, 0, 0, 0, 0, time.UTC),
+		time.Date(2025, 7, 4, 9, 5, 3, 0, time.FixedZone("PDT", -7*60*60)),
+		time.Date(10000, 1, 1, 0, 0, 0, 0, time.UTC),
+		{},
+	}
+
+	for _, tm := range times {
+		if got, want := formatCSVTime(tm), tm.Format(time.DateTime); got != want {
+			t.Errorf("formatCSVTime(%v) = %q, want %q", tm, got, want)
+		}
+	}
+}
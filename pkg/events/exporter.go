@@ -2,7 +2,6 @@
 package events
 
 import (
-	"encoding/csv"
 	"fmt"
 	"os"
 	"path/filepath"
@@ -10,6 +9,7 @@ import (
 	"strings"
 	"time"
 
+	"github.com/klauer/clash-royale-api/go/internal/csvutil"
 	"github.com/klauer/clash-royale-api/go/internal/storage"
 )
 
@@ -60,10 +60,17 @@ func NewExporter(options ExportOptions) *Exporter {
 	}
 }
 
+// exportTimestampLayout is the time layout used to stamp export filenames.
+const exportTimestampLayout = "20060102_150405"
+
 // Export performs the export operation using the configured options
 func (e *Exporter) Export(collection *EventDeckCollection) error {
+	// Capture the clock once so every artifact of this export agrees on it
+	now := time.Now()
+	stamp := now.Format(exportTimestampLayout)
+
 	// Apply filters to the collection
-	filtered := e.applyFilters(collection)
+	filtered := e.applyFilters(collection, now)
 
 	if len(filtered.Decks) == 0 {
 		return fmt.Errorf("no decks match the specified filters")
@@ -71,26 +78,26 @@ func (e *Exporter) Export(collection *EventDeckCollection) error {
 
 	// Group by event if requested
 	if e.options.GroupByEvent {
-		filtered = e.groupByEventType(filtered)
+		filtered = e.groupByEventType(filtered, now)
 	}
 
 	// Export based on format
 	switch e.options.Format {
 	case FormatCSV:
-		return e.exportCSV(filtered)
+		return e.exportCSV(filtered, stamp)
 	case FormatJSON:
-		return e.exportJSON(filtered)
+		return e.exportJSON(filtered, stamp)
 	case FormatDeckList:
-		return e.exportDeckList(filtered)
+		return e.exportDeckList(filtered, stamp)
 	case FormatRoyaleAPI:
-		return e.exportRoyaleAPI(filtered)
+		return e.exportRoyaleAPI(filtered, stamp)
 	default:
 		return fmt.Errorf("unsupported export format: %s", e.options.Format)
 	}
 }
 
 // applyFilters filters the event deck collection based on export options
-func (e *Exporter) applyFilters(collection *EventDeckCollection) *EventDeckCollection {
+func (e *Exporter) applyFilters(collection *EventDeckCollection, now time.Time) *EventDeckCollection {
 	var filteredDecks []EventDeck
 
 	for _, deck := range collection.Decks {
@@ -132,12 +139,12 @@ func (e *Exporter) applyFilters(collection *EventDeckCollection) *EventDeckColle
 	return &EventDeckCollection{
 		PlayerTag:   collection.PlayerTag,
 		Decks:       filteredDecks,
-		LastUpdated: time.Now(),
+		LastUpdated: now,
 	}
 }
 
 // groupByEventType creates separate collections for each event type
-func (e *Exporter) groupByEventType(collection *EventDeckCollection) *EventDeckCollection {
+func (e *Exporter) groupByEventType(collection *EventDeckCollection, now time.Time) *EventDeckCollection {
 	// For simplicity, we'll sort the decks by event type
 	// The actual grouping will be handled in the export functions
 	sortedDecks := make([]EventDeck, len(collection.Decks))
@@ -155,57 +162,48 @@ func (e *Exporter) groupByEventType(collection *EventDeckCollection) *EventDeckC
 	return &EventDeckCollection{
 		PlayerTag:   collection.PlayerTag,
 		Decks:       sortedDecks,
-		LastUpdated: time.Now(),
+		LastUpdated: now,
 	}
 }
 
 // exportCSV exports the collection to CSV format
-func (e *Exporter) exportCSV(collection *EventDeckCollection) error {
+func (e *Exporter) exportCSV(collection *EventDeckCollection, stamp string) error {
 	if err := storage.EnsureDirectory(e.options.OutputDir); err != nil {
 		return fmt.Errorf("failed to create output directory: %w", err)
 	}
 
-	filename := fmt.Sprintf("event_decks_%s.csv", time.Now().Format("20060102_150405"))
+	filename := fmt.Sprintf("event_decks_%s.csv", stamp)
 	filePath := filepath.Join(e.options.OutputDir, filename)
 
-	file, err := os.Create(filePath)
-	if err != nil {
-		return fmt.Errorf("failed to create CSV file: %w", err)
-	}
-	defer func() { _ = file.Close() }()
-
-	writer := csv.NewWriter(file)
-	if err := writer.Write(EventDeckCSVHeaders()); err != nil {
-		return fmt.Errorf("failed to write CSV headers: %w", err)
-	}
-
-	currentEventType := EventType("")
-	for _, deck := range collection.Decks {
-		if e.options.GroupByEvent && deck.EventType != currentEventType {
-			currentEventType = deck.EventType
-			if err := writer.Write(EventTypeSeparatorCSVRow(currentEventType)); err != nil {
-				return fmt.Errorf("failed to write event separator row: %w", err)
+	err := csvutil.WriteStream(filePath, eventDeckCSVHeaders, func(write func([]string) error) error {
+		currentEventType := EventType("")
+		for _, deck := range collection.Decks {
+			if e.options.GroupByEvent && deck.EventType != currentEventType {
+				currentEventType = deck.EventType
+				if err := write(EventTypeSeparatorCSVRow(currentEventType)); err != nil {
+					return err
+				}
+			}
+			if err := write(EventDeckCSVRow(deck)); err != nil {
+				return err
 			}
 		}
-		if err := writer.Write(EventDeckCSVRow(deck)); err != nil {
-			return fmt.Errorf("failed to write CSV row: %w", err)
-		}
-	}
-	writer.Flush()
-	if err := writer.Error(); err != nil {
-		return fmt.Errorf("failed to flush csv writer: %w", err)
+		return nil
+	})
+	if err != nil {
+		return fmt.Errorf("failed to write CSV export: %w", err)
 	}
 
 	return nil
 }
 
 // exportJSON exports the collection to JSON format
-func (e *Exporter) exportJSON(collection *EventDeckCollection) error {
+func (e *Exporter) exportJSON(collection *EventDeckCollection, stamp string) error {
 	if err := storage.EnsureDirectory(e.options.OutputDir); err != nil {
 		return fmt.Errorf("failed to create output directory: %w", err)
 	}
 
-	filename := fmt.Sprintf("event_decks_%s.json", time.Now().Format("20060102_150405"))
+	filename := fmt.Sprintf("event_decks_%s.json", stamp)
 	filePath := filepath.Join(e.options.OutputDir, filename)
 
 	if err := storage.WriteJSON(filePath, collection); err != nil {
@@ -216,12 +214,12 @@ func (e *Exporter) exportJSON(collection *EventDeckCollection) error {
 }
 
 // exportDeckList exports decks in a simple deck list format
-func (e *Exporter) exportDeckList(collection *EventDeckCollection) (returnErr error) {
+func (e *Exporter) exportDeckList(collection *EventDeckCollection, stamp string) (returnErr error) {
 	if err := os.MkdirAll(e.options.OutputDir, 0o755); err != nil {
 		return fmt.Errorf("failed to create output directory: %w", err)
 	}
 
-	filename := fmt.Sprintf("decks_%s.txt", time.Now().Format("20060102_150405"))
+	filename := fmt.Sprintf("decks_%s.txt", stamp)
 	filePath := filepath.Join(e.options.OutputDir, filename)
 
 	file, err := os.Create(filePath)
@@ -268,12 +266,12 @@ func (e *Exporter) exportDeckList(collection *EventDeckCollection) (returnErr er
 }
 
 // exportRoyaleAPI exports decks in RoyaleAPI deck link format
-func (e *Exporter) exportRoyaleAPI(collection *EventDeckCollection) (returnErr error) {
+func (e *Exporter) exportRoyaleAPI(collection *EventDeckCollection, stamp string) (returnErr error) {
 	if err := os.MkdirAll(e.options.OutputDir, 0o755); err != nil {
 		return fmt.Errorf("failed to create output directory: %w", err)
 	}
 
-	filename := fmt.Sprintf("deck_links_%s.txt", time.Now().Format("20060102_150405"))
+	filename := fmt.Sprintf("deck_links_%s.txt", stamp)
 	filePath := filepath.Join(e.options.OutputDir, filename)
 
 	file, err := os.Create(filePath)
@@ -5,8 +5,11 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"runtime"
 	"sort"
 	"strings"
+	"sync"
+	"sync/atomic"
 	"time"
 
 	"github.com/klauer/clash-royale-api/go/internal/playertag"
@@ -14,11 +17,16 @@ import (
 	"github.com/klauer/clash-royale-api/go/pkg/clashroyale"
 )
 
+// eventFileNameReplacer makes event names filesystem-safe in a single pass.
+var eventFileNameReplacer = strings.NewReplacer(" ", "_", "/", "_")
+
 // Manager manages event deck storage, retrieval, and analysis
 type Manager struct {
 	dataDir       string
 	eventDecksDir string
+	parserOnce    sync.Once
 	parser        *Parser
+	ensuredDirs   sync.Map // player directories whose subdirectories already exist
 }
 
 // NewManager creates a new event deck manager
@@ -28,10 +36,18 @@ func NewManager(dataDir string) *Manager {
 	return &Manager{
 		dataDir:       dataDir,
 		eventDecksDir: eventDecksDir,
-		parser:        NewParser(),
 	}
 }
 
+// battleParser returns the battle log parser, building it on first use so
+// managers that only read stored decks never construct it.
+func (m *Manager) battleParser() *Parser {
+	m.parserOnce.Do(func() {
+		m.parser = NewParser()
+	})
+	return m.parser
+}
+
 // getPlayerEventDir returns the directory for a player's event decks
 func (m *Manager) getPlayerEventDir(playerTag string) (string, error) {
 	cleanTag, err := playertag.Sanitize(playerTag)
@@ -41,13 +57,21 @@ func (m *Manager) getPlayerEventDir(playerTag string) (string, error) {
 	return filepath.Join(m.eventDecksDir, cleanTag), nil
 }
 
-// ensurePlayerDirectories creates all necessary subdirectories for a player
-func (m *Manager) ensurePlayerDirectories(playerTag string) error {
-	playerDir, err := m.getPlayerEventDir(playerTag)
-	if err != nil {
+// ensurePlayerDirectoriesAt creates the player's subdirectories once per manager,
+// so repeated saves for the same player skip the MkdirAll calls.
+func (m *Manager) ensurePlayerDirectoriesAt(playerDir string) error {
+	if _, ok := m.ensuredDirs.Load(playerDir); ok {
+		return nil
+	}
+	if err := createPlayerDirectories(playerDir); err != nil {
 		return err
 	}
+	m.ensuredDirs.Store(playerDir, struct{}{})
+	return nil
+}
 
+// createPlayerDirectories creates the event subdirectories under an already resolved player directory
+func createPlayerDirectories(playerDir string) error {
 	// Create subdirectories
 	dirs := []string{
 		playerDir,
@@ -68,52 +92,44 @@ func (m *Manager) ensurePlayerDirectories(playerTag string) error {
 
 // SaveEventDeck saves an event deck to the file system
 func (m *Manager) SaveEventDeck(eventDeck *EventDeck) error {
-	if err := m.ensurePlayerDirectories(eventDeck.PlayerTag); err != nil {
-		return err
-	}
-
 	playerDir, err := m.getPlayerEventDir(eventDeck.PlayerTag)
 	if err != nil {
 		return err
 	}
+	if err := m.ensurePlayerDirectoriesAt(playerDir); err != nil {
+		return err
+	}
 
 	// Determine subdirectory based on event type
-	var subdir string
-	switch eventDeck.EventType {
-	case EventTypeTournament:
-		subdir = filepath.Join(playerDir, "tournaments")
-	case EventTypeSpecialEvent:
-		subdir = filepath.Join(playerDir, "special_events")
-	default:
-		subdir = filepath.Join(playerDir, "challenges")
-	}
-
-	// Generate filename
-	timestamp := eventDeck.StartTime.Format("2006-01-02")
-	eventName := strings.ToLower(eventDeck.EventName)
-	eventName = strings.ReplaceAll(eventName, " ", "_")
-	eventName = strings.ReplaceAll(eventName, "/", "_")
-	filename := fmt.Sprintf("%s_%s.json", timestamp, eventName)
-	filePath := filepath.Join(subdir, filename)
+	subdir := getSubdirectoryForEventType(eventDeck.EventType, playerDir)
+	filePath := filepath.Join(subdir, eventDeckFileName(eventDeck))
 
 	if err := storage.WriteJSON(filePath, eventDeck); err != nil {
 		return fmt.Errorf("failed to write event deck file: %w", err)
 	}
 
 	// Update collection file
-	if err := m.updateCollectionFile(eventDeck); err != nil {
+	if err := updateCollectionFile(playerDir, eventDeck); err != nil {
 		return fmt.Errorf("failed to update collection: %w", err)
 	}
 
 	return nil
 }
 
+// eventDeckFileName returns "<start date>_<event name>.json" for an event deck,
+// building the name in one buffer instead of formatting it piecewise.
+func eventDeckFileName(eventDeck *EventDeck) string {
+	eventName := eventFileNameReplacer.Replace(strings.ToLower(eventDeck.EventName))
+	buf := make([]byte, 0, len("2006-01-02_")+len(eventName)+len(".json"))
+	buf = eventDeck.StartTime.AppendFormat(buf, time.DateOnly)
+	buf = append(buf, '_')
+	buf = append(buf, eventName...)
+	buf = append(buf, ".json"...)
+	return string(buf)
+}
+
 // updateCollectionFile updates the player's event deck collection file
-func (m *Manager) updateCollectionFile(eventDeck *EventDeck) error {
-	playerDir, err := m.getPlayerEventDir(eventDeck.PlayerTag)
-	if err != nil {
-		return err
-	}
+func updateCollectionFile(playerDir string, eventDeck *EventDeck) error {
 	collectionFile := filepath.Join(playerDir, "collection.json")
 
 	// Load existing collection
@@ -122,20 +138,14 @@ func (m *Manager) updateCollectionFile(eventDeck *EventDeck) error {
 		// File exists, unmarshal it
 		if err := json.Unmarshal(data, &collection); err != nil {
 			// If unmarshal fails, create new collection
-			collection = EventDeckCollection{
-				PlayerTag:   eventDeck.PlayerTag,
-				LastUpdated: time.Now(),
-			}
+			collection = EventDeckCollection{PlayerTag: eventDeck.PlayerTag}
 		}
 	} else {
 		// File doesn't exist, create new collection
-		collection = EventDeckCollection{
-			PlayerTag:   eventDeck.PlayerTag,
-			LastUpdated: time.Now(),
-		}
+		collection = EventDeckCollection{PlayerTag: eventDeck.PlayerTag}
 	}
 
-	// Add the deck
+	// Add the deck (AddDeck stamps LastUpdated)
 	collection.AddDeck(*eventDeck)
 
 	if err := storage.WriteJSON(collectionFile, collection); err != nil {
@@ -162,19 +172,11 @@ func (m *Manager) GetEventDecks(playerTag string, opts *GetEventDeckOptions) ([]
 	if err != nil {
 		return nil, err
 	}
-	decks := make([]EventDeck, 0)
 
 	// Determine which subdirectories to search
 	var subdirs []string
 	if opts.EventType != nil {
-		switch *opts.EventType {
-		case EventTypeTournament:
-			subdirs = []string{filepath.Join(playerDir, "tournaments")}
-		case EventTypeSpecialEvent:
-			subdirs = []string{filepath.Join(playerDir, "special_events")}
-		default:
-			subdirs = []string{filepath.Join(playerDir, "challenges")}
-		}
+		subdirs = []string{getSubdirectoryForEventType(*opts.EventType, playerDir)}
 	} else {
 		subdirs = []string{
 			filepath.Join(playerDir, "challenges"),
@@ -183,67 +185,184 @@ func (m *Manager) GetEventDecks(playerTag string, opts *GetEventDeckOptions) ([]
 		}
 	}
 
+	files := listEventDeckFiles(subdirs)
+
 	// Calculate cutoff time if days_back is specified
 	var cutoff time.Time
 	if opts.DaysBack != nil {
 		cutoff = time.Now().AddDate(0, 0, -*opts.DaysBack)
+		files = skipEventDeckFilesBefore(files, cutoff)
+	}
+
+	// Read files but decode only start times until filtering and the limit
+	// have picked the decks to return
+	stored := readEventDeckFiles(files)
+	if opts.DaysBack != nil {
+		stored = storedEventDecksSince(stored, cutoff)
 	}
 
-	// Load decks from subdirectories
+	// Sort by start time (newest first)
+	sort.Slice(stored, func(i, j int) bool {
+		return stored[i].startTime.After(stored[j].startTime)
+	})
+
+	if opts.Limit == nil {
+		return decodeEventDecks(stored), nil
+	}
+	return decodeNewestEventDecks(stored, *opts.Limit), nil
+}
+
+// decodeNewestEventDecks decodes up to limit decks from sorted stored decks.
+// Decks that fail to decode are replaced by the next entries in order, so the
+// result is the same as decoding everything and then applying the limit.
+func decodeNewestEventDecks(stored []storedEventDeck, limit int) []EventDeck {
+	next := min(max(limit, 0), len(stored))
+	decks := decodeEventDecks(stored[:next])
+	for len(decks) < limit && next < len(stored) {
+		end := min(next+limit-len(decks), len(stored))
+		decks = append(decks, decodeEventDecks(stored[next:end])...)
+		next = end
+	}
+	return decks
+}
+
+// listEventDeckFiles returns the stored event deck files in the given
+// subdirectories, skipping missing directories and collection files.
+func listEventDeckFiles(subdirs []string) []string {
+	var files []string
 	for _, subdir := range subdirs {
 		if _, err := os.Stat(subdir); os.IsNotExist(err) {
 			continue
 		}
 
-		files, err := filepath.Glob(filepath.Join(subdir, "*.json"))
+		matches, err := filepath.Glob(filepath.Join(subdir, "*.json"))
 		if err != nil {
 			continue
 		}
 
-		for _, filePath := range files {
+		for _, filePath := range matches {
 			// Skip collection file
-			if filepath.Base(filePath) == "collection.json" {
-				continue
+			if filepath.Base(filePath) != "collection.json" {
+				files = append(files, filePath)
 			}
+		}
+	}
+	return files
+}
 
-			// Read file
-			data, err := os.ReadFile(filePath)
-			if err != nil {
+// skipEventDeckFilesBefore drops files whose "YYYY-MM-DD_" name prefix (see
+// eventDeckFileName) is clearly older than cutoff, so they are never read.
+// The prefix is written in the deck's own time zone, so a day of slack is
+// allowed; the exact StartTime check still runs after loading. Files without
+// a date prefix are kept.
+func skipEventDeckFilesBefore(files []string, cutoff time.Time) []string {
+	minDate := cutoff.UTC().AddDate(0, 0, -1).Format(time.DateOnly)
+	kept := files[:0]
+	for _, filePath := range files {
+		name := filepath.Base(filePath)
+		if len(name) > len(time.DateOnly) && name[len(time.DateOnly)] == '_' {
+			if _, err := time.Parse(time.DateOnly, name[:len(time.DateOnly)]); err == nil &&
+				name[:len(time.DateOnly)] < minDate {
 				continue
 			}
+		}
+		kept = append(kept, filePath)
+	}
+	return kept
+}
 
-			// Unmarshal deck
-			var deck EventDeck
-			if err := json.Unmarshal(data, &deck); err != nil {
-				continue
-			}
+// storedEventDeck is an event deck file read from disk with only the start
+// time decoded, enough to filter and order decks before decoding them fully.
+type storedEventDeck struct {
+	data      []byte
+	startTime time.Time
+}
 
-			// Apply filters
-			if opts.DaysBack != nil && deck.StartTime.Before(cutoff) {
-				continue
-			}
+// eventDeckStartTime decodes just the start time of a stored event deck.
+type eventDeckStartTime struct {
+	StartTime time.Time `json:"start_time"`
+}
+
+// readEventDeckFiles reads deck files and decodes their start times on a small
+// worker pool, keeping input order and dropping files that cannot be read or
+// decoded.
+func readEventDeckFiles(files []string) []storedEventDeck {
+	stored := make([]storedEventDeck, len(files))
+	ok := make([]bool, len(files))
+	forEachConcurrently(len(files), func(i int) {
+		data, err := os.ReadFile(files[i])
+		if err != nil {
+			return
+		}
+		var header eventDeckStartTime
+		if json.Unmarshal(data, &header) != nil {
+			return
+		}
+		stored[i] = storedEventDeck{data: data, startTime: header.StartTime}
+		ok[i] = true
+	})
 
-			decks = append(decks, deck)
+	kept := stored[:0]
+	for i := range stored {
+		if ok[i] {
+			kept = append(kept, stored[i])
 		}
 	}
+	return kept
+}
 
-	// Sort by start time (newest first)
-	sort.Slice(decks, func(i, j int) bool {
-		return decks[i].StartTime.After(decks[j].StartTime)
+// storedEventDecksSince drops stored decks that started before cutoff.
+func storedEventDecksSince(stored []storedEventDeck, cutoff time.Time) []storedEventDeck {
+	kept := stored[:0]
+	for _, entry := range stored {
+		if !entry.startTime.Before(cutoff) {
+			kept = append(kept, entry)
+		}
+	}
+	return kept
+}
+
+// decodeEventDecks fully decodes stored decks on a small worker pool, keeping
+// their order and dropping any that fail to decode.
+func decodeEventDecks(stored []storedEventDeck) []EventDeck {
+	loaded := make([]EventDeck, len(stored))
+	ok := make([]bool, len(stored))
+	forEachConcurrently(len(stored), func(i int) {
+		ok[i] = json.Unmarshal(stored[i].data, &loaded[i]) == nil
 	})
 
-	// Apply limit
-	if opts.Limit != nil && len(decks) > *opts.Limit {
-		decks = decks[:*opts.Limit]
+	decks := loaded[:0]
+	for i := range loaded {
+		if ok[i] {
+			decks = append(decks, loaded[i])
+		}
 	}
+	return decks
+}
 
-	return decks, nil
+// forEachConcurrently calls fn for every index in [0, n) using up to
+// GOMAXPROCS goroutines.
+func forEachConcurrently(n int, fn func(i int)) {
+	var next atomic.Int64
+	var wg sync.WaitGroup
+	for range min(runtime.GOMAXPROCS(0), n) {
+		wg.Go(func() {
+			for {
+				i := int(next.Add(1) - 1)
+				if i >= n {
+					return
+				}
+				fn(i)
+			}
+		})
+	}
+	wg.Wait()
 }
 
 // ImportFromBattleLogs imports event decks from battle logs
 func (m *Manager) ImportFromBattleLogs(battleLogs []clashroyale.Battle, playerTag string) ([]EventDeck, error) {
 	// Parse battle logs
-	eventDecks, err := m.parser.ParseBattleLogs(battleLogs, playerTag)
+	eventDecks, err := m.battleParser().ParseBattleLogs(battleLogs, playerTag)
 	if err != nil {
 		return nil, fmt.Errorf("failed to parse battle logs: %w", err)
 	}
@@ -292,18 +411,20 @@ func (m *Manager) GetCollection(playerTag string) (*EventDeckCollection, error)
 
 // Helper functions for Manager methods
 func getSubdirectoryForEventType(eventType EventType, playerDir string) string {
-	var subdirName string
-	switch eventType {
-	case EventTypeTournament:
-		subdirName = "tournaments"
-	case EventTypeSpecialEvent:
-		subdirName = "special_events"
-	default:
+	subdirName, exists := eventTypeSubdirs[eventType]
+	if !exists {
 		subdirName = "challenges"
 	}
 	return filepath.Join(playerDir, subdirName)
 }
 
+// eventTypeSubdirs maps event types stored outside the default "challenges"
+// directory to their subdirectory.
+var eventTypeSubdirs = map[EventType]string{
+	EventTypeTournament:   "tournaments",
+	EventTypeSpecialEvent: "special_events",
+}
+
 func findDeckInCollection(collection *EventDeckCollection, eventID string) *EventDeck {
 	for i := range collection.Decks {
 		if collection.Decks[i].EventID == eventID {
@@ -313,6 +434,11 @@ func findDeckInCollection(collection *EventDeckCollection, eventID string) *Even
 	return nil
 }
 
+// eventDeckID is the subset of a stored EventDeck needed to identify its file.
+type eventDeckID struct {
+	EventID string `json:"event_id"`
+}
+
 func findDeckFileInDirectory(subdir, eventID string) (string, error) {
 	files, err := filepath.Glob(filepath.Join(subdir, "*.json"))
 	if err != nil {
@@ -329,7 +455,8 @@ func findDeckFileInDirectory(subdir, eventID string) (string, error) {
 			continue
 		}
 
-		var deck EventDeck
+		// Only the ID is needed to match, so skip decoding the deck, battles and performance.
+		var deck eventDeckID
 		if err := json.Unmarshal(data, &deck); err != nil {
 			continue
 		}
@@ -355,12 +482,7 @@ func removeEventDeckFromCollection(collection *EventDeckCollection, eventID stri
 
 func persistUpdatedCollection(playerDir string, collection *EventDeckCollection) error {
 	collectionFile := filepath.Join(playerDir, "collection.json")
-	collectionData, err := json.MarshalIndent(collection, "", "  ")
-	if err != nil {
-		return fmt.Errorf("failed to marshal collection: %w", err)
-	}
-
-	if err := os.WriteFile(collectionFile, collectionData, 0o644); err != nil {
+	if err := storage.WriteJSON(collectionFile, collection); err != nil {
 		return fmt.Errorf("failed to write collection file: %w", err)
 	}
 
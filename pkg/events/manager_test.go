@@ -20,8 +20,11 @@ func TestNewManager(t *testing.T) {
 	if manager.dataDir != tempDir {
 		t.Errorf("dataDir = %s, want %s", manager.dataDir, tempDir)
 	}
-	if manager.parser == nil {
-		t.Error("parser should be initialized")
+	if manager.parser != nil {
+		t.Error("parser should be built lazily")
+	}
+	if manager.battleParser() == nil {
+		t.Error("battleParser should initialize the parser")
 	}
 }
 
@@ -29,17 +32,15 @@ func TestManager_EnsurePlayerDirectories(t *testing.T) {
 	tempDir := t.TempDir()
 	manager := NewManager(tempDir)
 
-	playerTag := "#TEST123"
-	err := manager.ensurePlayerDirectories(playerTag)
+	playerDir, err := manager.getPlayerEventDir("#TEST123")
 	if err != nil {
-		t.Fatalf("ensurePlayerDirectories failed: %v", err)
+		t.Fatalf("getPlayerEventDir failed: %v", err)
+	}
+	if err := manager.ensurePlayerDirectoriesAt(playerDir); err != nil {
+		t.Fatalf("ensurePlayerDirectoriesAt failed: %v", err)
 	}
 
 	// Check that directories were created
-	playerDir, err := manager.getPlayerEventDir(playerTag)
-	if err != nil {
-		t.Fatalf("getPlayerEventDir failed: %v", err)
-	}
 	dirs := []string{
 		playerDir,
 		filepath.Join(playerDir, "challenges"),
@@ -144,6 +145,18 @@ func TestManager_SaveEventDeck(t *testing.T) {
 	}
 }
 
+func TestEventDeckFileName(t *testing.T) {
+	eventDeck := &EventDeck{
+		EventName: "Classic Challenge/Mega Draft",
+		StartTime: time.Date(2024, time.March, 7, 18, 30, 0, 0, time.UTC),
+	}
+
+	want := "2024-03-07_classic_challenge_mega_draft.json"
+	if got := eventDeckFileName(eventDeck); got != want {
+		t.Errorf("eventDeckFileName() = %q, want %q", got, want)
+	}
+}
+
 func TestManager_SaveEventDeck_DifferentTypes(t *testing.T) {
 	tempDir := t.TempDir()
 	manager := NewManager(tempDir)
@@ -341,6 +354,50 @@ func TestManager_GetEventDecks(t *testing.T) {
 			t.Errorf("GetEventDecks returned %d decks, want 2 (limit applied)", len(retrieved))
 		}
 	})
+
+	t.Run("Limit skips decks that fail to decode", func(t *testing.T) {
+		playerDir, err := manager.getPlayerEventDir("#TEST123")
+		if err != nil {
+			t.Fatalf("getPlayerEventDir failed: %v", err)
+		}
+		// The start time decodes, so the file sorts first, but the deck does not
+		corrupt := `{"event_id": "corrupt", "start_time": "` + baseTime.Add(time.Hour).Format(time.RFC3339) + `", "deck": "invalid"}`
+		corruptFile := filepath.Join(playerDir, "challenges", "corrupt.json")
+		if err := os.WriteFile(corruptFile, []byte(corrupt), 0o644); err != nil {
+			t.Fatalf("Failed to write corrupt deck: %v", err)
+		}
+
+		limit := 2
+		retrieved, err := manager.GetEventDecks("#TEST123", &GetEventDeckOptions{Limit: &limit})
+		if err != nil {
+			t.Fatalf("GetEventDecks failed: %v", err)
+		}
+
+		if len(retrieved) != 2 || retrieved[0].EventID != "deck_1" || retrieved[1].EventID != "deck_2" {
+			t.Errorf("GetEventDecks returned %+v, want deck_1 and deck_2", retrieved)
+		}
+	})
+}
+
+func TestSkipEventDeckFilesBefore(t *testing.T) {
+	cutoff := time.Date(2024, time.March, 10, 12, 0, 0, 0, time.UTC)
+	files := []string{
+		filepath.Join("challenges", "2024-03-01_old_challenge.json"),
+		filepath.Join("challenges", "2024-03-09_boundary_challenge.json"),
+		filepath.Join("tournaments", "2024-03-12_recent_tournament.json"),
+		filepath.Join("tournaments", "legacy_tournament.json"),
+	}
+
+	want := []string{files[1], files[2], files[3]}
+	got := skipEventDeckFilesBefore(files, cutoff)
+	if len(got) != len(want) {
+		t.Fatalf("skipEventDeckFilesBefore() returned %v, want %v", got, want)
+	}
+	for i := range want {
+		if got[i] != want[i] {
+			t.Errorf("file[%d] = %q, want %q", i, got[i], want[i])
+		}
+	}
 }
 
 func TestManager_ImportFromBattleLogs(t *testing.T) {
@@ -351,7 +351,6 @@ func (p *Parser) createEventDeck(group eventGroup, playerTag string) (*EventDeck
 		StartTime:   group.startTime,
 		Deck:        deck,
 		Performance: performance,
-		Battles:     make([]BattleRecord, 0, len(group.battles)),
 		EventRules: map[string]any{
 			"battle_mode": group.battleMode,
 			"is_ladder":   false,
@@ -359,12 +358,13 @@ func (p *Parser) createEventDeck(group eventGroup, playerTag string) (*EventDeck
 	}
 
 	// Add all battles
-	for _, battle := range group.battles {
-		battleRecord := p.createBattleRecord(battle, playerTag)
-		if battleRecord != nil {
-			eventDeck.AddBattle(*battleRecord)
+	battles := make([]BattleRecord, 0, len(group.battles))
+	for i := range group.battles {
+		if battleRecord, ok := p.createBattleRecord(&group.battles[i], playerTag); ok {
+			battles = append(battles, battleRecord)
 		}
 	}
+	eventDeck.AddBattles(battles)
 
 	// Set max_wins based on event type
 	switch group.eventType {
@@ -385,10 +385,11 @@ func (p *Parser) createEventDeck(group eventGroup, playerTag string) (*EventDeck
 	return &eventDeck, nil
 }
 
-// createBattleRecord creates a BattleRecord from battle data
-func (p *Parser) createBattleRecord(battle clashroyale.Battle, playerTag string) *BattleRecord {
+// createBattleRecord creates a BattleRecord from battle data, reporting false
+// when the battle lacks team or opponent data
+func (p *Parser) createBattleRecord(battle *clashroyale.Battle, playerTag string) (BattleRecord, bool) {
 	if len(battle.Team) == 0 || len(battle.Opponent) == 0 {
-		return nil
+		return BattleRecord{}, false
 	}
 
 	// Determine win/loss
@@ -411,7 +412,7 @@ func (p *Parser) createBattleRecord(battle clashroyale.Battle, playerTag string)
 	playerDeck := extractCardNames(battle.Team[0].Cards)
 	opponentDeck := extractCardNames(battle.Opponent[0].Cards)
 
-	return &BattleRecord{
+	return BattleRecord{
 		Timestamp:             battle.UTCDate,
 		OpponentTag:           battle.Opponent[0].Tag,
 		OpponentName:          battle.Opponent[0].Name,
@@ -426,7 +427,7 @@ func (p *Parser) createBattleRecord(battle clashroyale.Battle, playerTag string)
 		OpponentDeckHash:      deckHash(opponentDeck),
 		PlayerDeckArchetype:   inferDeckArchetype(playerDeck),
 		OpponentDeckArchetype: inferDeckArchetype(opponentDeck),
-	}
+	}, true
 }
 
 func extractCardNames(cards []clashroyale.Card) []string {
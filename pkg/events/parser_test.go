@@ -454,12 +454,12 @@ func TestParser_CreateBattleRecord(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			result := parser.createBattleRecord(tt.battle, "#PLAYER")
-			if (result == nil) != tt.wantNil {
-				t.Errorf("createBattleRecord() nil = %v, wantNil = %v", result == nil, tt.wantNil)
+			result, ok := parser.createBattleRecord(&tt.battle, "#PLAYER")
+			if ok == tt.wantNil {
+				t.Errorf("createBattleRecord() ok = %v, wantNil = %v", ok, tt.wantNil)
 			}
 
-			if !tt.wantNil && result != nil {
+			if !tt.wantNil && ok {
 				// Verify basic fields
 				if result.Timestamp != battleTime {
 					t.Errorf("Timestamp = %v, want %v", result.Timestamp, battleTime)
@@ -559,11 +559,11 @@ func TestParser_CreateBattleRecord_DeckHashNormalization(t *testing.T) {
 		},
 	}
 
-	recordA := parser.createBattleRecord(battleA, "#PLAYER")
-	recordB := parser.createBattleRecord(battleB, "#PLAYER")
+	recordA, okA := parser.createBattleRecord(&battleA, "#PLAYER")
+	recordB, okB := parser.createBattleRecord(&battleB, "#PLAYER")
 
-	if recordA == nil || recordB == nil {
-		t.Fatal("expected non-nil records")
+	if !okA || !okB {
+		t.Fatal("expected records for both battles")
 	}
 
 	if recordA.PlayerDeckHash != recordB.PlayerDeckHash {
@@ -5,6 +5,7 @@ package events
 import (
 	"encoding/json"
 	"fmt"
+	"sort"
 	"time"
 
 	"github.com/klauer/clash-royale-api/go/internal/errors"
@@ -177,28 +178,54 @@ type EventDeck struct {
 // AddBattle adds a battle record to the event and updates performance metrics
 func (ed *EventDeck) AddBattle(battle BattleRecord) {
 	ed.Battles = append(ed.Battles, battle)
+	ed.Performance.recordBattle(&battle)
+	ed.refreshProgress()
+}
+
+// AddBattles adds battle records in order and updates performance metrics,
+// recalculating the win rate, progress and end time once for the whole batch.
+// A deck with no Battles slice yet takes ownership of battles instead of
+// copying it.
+func (ed *EventDeck) AddBattles(battles []BattleRecord) {
+	if ed.Battles == nil {
+		ed.Battles = battles
+	} else {
+		ed.Battles = append(ed.Battles, battles...)
+	}
+	if len(battles) == 0 {
+		return
+	}
+	for i := range battles {
+		ed.Performance.recordBattle(&battles[i])
+	}
+	ed.refreshProgress()
+}
+
+// recordBattle updates crowns, wins, losses and streaks for one battle
+func (ep *EventPerformance) recordBattle(battle *BattleRecord) {
+	ep.CrownsEarned += battle.Crowns
+	ep.CrownsLost += battle.OpponentCrowns
 
-	// Update performance metrics
 	if battle.IsWin() {
-		ed.Performance.Wins++
-		ed.Performance.CurrentStreak++
-		if ed.Performance.CurrentStreak > ed.Performance.BestStreak {
-			ed.Performance.BestStreak = ed.Performance.CurrentStreak
+		ep.Wins++
+		ep.CurrentStreak++
+		if ep.CurrentStreak > ep.BestStreak {
+			ep.BestStreak = ep.CurrentStreak
 		}
 	} else if battle.IsLoss() {
-		ed.Performance.Losses++
-		ed.Performance.CurrentStreak = 0
+		ep.Losses++
+		ep.CurrentStreak = 0
 	}
+}
 
-	ed.Performance.CrownsEarned += battle.Crowns
-	ed.Performance.CrownsLost += battle.OpponentCrowns
-
-	// Recalculate win rate and progress
+// refreshProgress recalculates win rate and progress, and records the end
+// time the first time the event is no longer in progress
+func (ed *EventDeck) refreshProgress() {
 	ed.Performance.CalculateWinRate()
 	ed.Performance.UpdateProgress()
 
-	// Set end time if event is completed
-	if ed.Performance.Progress != EventProgressInProgress {
+	// Set end time if event is completed and has no end time yet
+	if ed.EndTime == nil && ed.Performance.Progress != EventProgressInProgress {
 		now := time.Now()
 		ed.EndTime = &now
 	}
@@ -250,15 +277,12 @@ func (edc *EventDeckCollection) GetBestDecksByWinRate(minBattles, limit int) []E
 		return deck.Performance.TotalBattles() >= minBattles
 	})
 
-	// Sort by win rate (descending)
-	// Note: In production, use sort.Slice for actual sorting
-	// This is a placeholder for the type definition
-
-	if len(qualified) > limit {
-		return qualified[:limit]
-	}
+	// Sort by win rate (descending), keeping Decks order for equal win rates
+	sort.SliceStable(qualified, func(i, j int) bool {
+		return qualified[i].Performance.WinRate > qualified[j].Performance.WinRate
+	})
 
-	return qualified
+	return qualified[:max(min(limit, len(qualified)), 0)]
 }
 
 // EventMetadata represents metadata about an event type, independent of player participation
@@ -0,0 +1,150 @@
+package events
+
+import "testing"
+
+func TestEventDeckCollection_AddDeckUpdatesByEventID(t *testing.T) {
+	collection := &EventDeckCollection{PlayerTag: "#TEST"}
+	collection.AddDeck(EventDeck{EventID: "a", Notes: "first"})
+	collection.AddDeck(EventDeck{EventID: "b"})
+	collection.AddDeck(EventDeck{EventID: "a", Notes: "updated"})
+
+	if len(collection.Decks) != 2 {
+		t.Fatalf("len(Decks) = %d, want 2", len(collection.Decks))
+	}
+	if collection.Decks[0].Notes != "updated" {
+		t.Errorf("Decks[0].Notes = %q, want %q", collection.Decks[0].Notes, "updated")
+	}
+	if collection.LastUpdated.IsZero() {
+		t.Error("AddDeck() should set LastUpdated")
+	}
+}
+
+func TestEventDeckCollection_GetBestDecksByWinRate(t *testing.T) {
+	newDeck := func(id string, wins, losses int) EventDeck {
+		deck := EventDeck{EventID: id, Performance: EventPerformance{Wins: wins, Losses: losses}}
+		deck.Performance.CalculateWinRate()
+		return deck
+	}
+	ranked := []EventDeck{
+		newDeck("low", 1, 3),
+		newDeck("unqualified", 1, 0),
+		newDeck("high", 4, 0),
+		newDeck("mid", 2, 2),
+	}
+	tied := []EventDeck{
+		newDeck("a", 2, 2),
+		newDeck("b", 2, 2),
+		newDeck("c", 4, 0),
+	}
+
+	tests := []struct {
+		name  string
+		decks []EventDeck
+		limit int
+		want  []string
+	}{
+		{name: "top two", decks: ranked, limit: 2, want: []string{"high", "mid"}},
+		{name: "all qualified", decks: ranked, limit: 10, want: []string{"high", "mid", "low"}},
+		{name: "zero limit", decks: ranked, limit: 0, want: []string{}},
+		{name: "ties keep deck order", decks: tied, limit: 2, want: []string{"c", "a"}},
+		{name: "ties keep deck order without limit", decks: tied, limit: 3, want: []string{"c", "a", "b"}},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			collection := &EventDeckCollection{Decks: tt.decks}
+			got := collection.GetBestDecksByWinRate(3, tt.limit)
+			if len(got) != len(tt.want) {
+				t.Fatalf("GetBestDecksByWinRate() returned %d decks, want %d", len(got), len(tt.want))
+			}
+			for i, id := range tt.want {
+				if got[i].EventID != id {
+					t.Errorf("deck[%d] = %q, want %q", i, got[i].EventID, id)
+				}
+			}
+		})
+	}
+}
+
+func TestEventDeck_AddBattleDrawKeepsDerivedMetrics(t *testing.T) {
+	maxWins := 1
+	eventDeck := &EventDeck{
+		Performance: EventPerformance{MaxWins: &maxWins, Progress: EventProgressInProgress},
+	}
+	eventDeck.AddBattle(BattleRecord{Result: BattleResultWin, Crowns: 3, OpponentCrowns: 1})
+	if eventDeck.EndTime == nil {
+		t.Fatal("AddBattle() should set EndTime once the event completes")
+	}
+	endTime := eventDeck.EndTime
+
+	eventDeck.AddBattle(BattleRecord{Result: BattleResultDraw, Crowns: 1, OpponentCrowns: 1})
+
+	if got := len(eventDeck.Battles); got != 2 {
+		t.Errorf("len(Battles) = %d, want 2", got)
+	}
+	if eventDeck.Performance.CrownsEarned != 4 || eventDeck.Performance.CrownsLost != 2 {
+		t.Errorf("crowns = %d/%d, want 4/2", eventDeck.Performance.CrownsEarned, eventDeck.Performance.CrownsLost)
+	}
+	if eventDeck.Performance.WinRate != 1 {
+		t.Errorf("WinRate = %v, want 1", eventDeck.Performance.WinRate)
+	}
+	if eventDeck.EndTime != endTime {
+		t.Errorf("EndTime was reset by a draw: got %v, want %v", *eventDeck.EndTime, *endTime)
+	}
+}
+
+func TestEventDeck_AddBattleDrawOnFreshDeckIsInProgress(t *testing.T) {
+	eventDeck := &EventDeck{}
+	eventDeck.AddBattle(BattleRecord{Result: BattleResultDraw, Crowns: 1, OpponentCrowns: 1})
+
+	if eventDeck.Performance.Progress != EventProgressInProgress {
+		t.Errorf("Progress = %q, want %q", eventDeck.Performance.Progress, EventProgressInProgress)
+	}
+	if eventDeck.EndTime != nil {
+		t.Errorf("EndTime = %v, want nil", *eventDeck.EndTime)
+	}
+}
+
+func TestEventDeck_AddBattlesMatchesAddBattle(t *testing.T) {
+	battles := []BattleRecord{
+		{Result: BattleResultWin, Crowns: 3, OpponentCrowns: 0},
+		{Result: BattleResultWin, Crowns: 1, OpponentCrowns: 0},
+		{Result: BattleResultDraw, Crowns: 1, OpponentCrowns: 1},
+		{Result: BattleResultLoss, Crowns: 0, OpponentCrowns: 2},
+		{Result: BattleResultWin, Crowns: 2, OpponentCrowns: 1},
+	}
+
+	oneByOne := &EventDeck{Performance: EventPerformance{Progress: EventProgressInProgress}}
+	for _, battle := range battles {
+		oneByOne.AddBattle(battle)
+	}
+	batched := &EventDeck{Performance: EventPerformance{Progress: EventProgressInProgress}}
+	batched.AddBattles(battles)
+
+	if batched.Performance != oneByOne.Performance {
+		t.Errorf("AddBattles() performance = %+v, want %+v", batched.Performance, oneByOne.Performance)
+	}
+	if len(batched.Battles) != len(battles) {
+		t.Errorf("len(Battles) = %d, want %d", len(batched.Battles), len(battles))
+	}
+	if batched.Performance.BestStreak != 2 || batched.Performance.CurrentStreak != 1 {
+		t.Errorf("streaks = best %d current %d, want best 2 current 1",
+			batched.Performance.BestStreak, batched.Performance.CurrentStreak)
+	}
+}
+
+func TestEventDeck_AddBattleKeepsFirstEndTime(t *testing.T) {
+	eventDeck := &EventDeck{Performance: EventPerformance{Progress: EventProgressInProgress}}
+	for range 3 {
+		eventDeck.AddBattle(BattleRecord{Result: BattleResultLoss, OpponentCrowns: 1})
+	}
+	if eventDeck.Performance.Progress != EventProgressEliminated || eventDeck.EndTime == nil {
+		t.Fatalf("after 3 losses: progress = %q, end time set = %v", eventDeck.Performance.Progress, eventDeck.EndTime != nil)
+	}
+	endTime := eventDeck.EndTime
+
+	eventDeck.AddBattle(BattleRecord{Result: BattleResultLoss, OpponentCrowns: 1})
+	if eventDeck.EndTime != endTime {
+		t.Errorf("EndTime was reset after the event ended: got %v, want %v", *eventDeck.EndTime, *endTime)
+	}
+}